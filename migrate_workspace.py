@@ -6,10 +6,12 @@ Migrates all content from one Qase workspace to another, preserving structure,
 links, attachments, and relationships.
 """
 import argparse
+import atexit
 import json
 import logging
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from queue import Queue
 from typing import Any, Dict, List, Optional, Tuple
@@ -18,6 +20,7 @@ from qase_service import QaseService
 from migration.progress import init_tqdm_lock, stderr_supports_progress
 from migration.run_single_project import run_single_project_migration
 from migration.utils import (
+    DEFAULT_MAPPINGS_FLUSH_INTERVAL,
     MigrationMappings,
     MigrationStats,
     fork_mappings_for_parallel_project,
@@ -33,14 +36,50 @@ from migration.create import (
     migrate_groups,
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('migration.log'),
-        logging.StreamHandler(sys.stdout)
+BANNER = "=" * 60
+
+# migration.log rotates at LOG_FILE_MAX_BYTES; records are written in batches of
+# LOG_FILE_BUFFER_RECORDS (ERROR and above flush immediately).
+LOG_FILE_MAX_BYTES = 50_000_000
+LOG_FILE_BACKUP_COUNT = 5
+LOG_FILE_BUFFER_RECORDS = 1000
+
+
+def _configure_logging() -> None:
+    """
+    Log to migration.log and stdout through a QueueListener thread, so migration
+    workers only enqueue records and never block on file or console writes. The
+    file side is buffered and rotating; logging.shutdown() flushes it at exit.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = RotatingFileHandler(
+        'migration.log',
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT,
+    )
+    console_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+    handlers: List[logging.Handler] = [
+        MemoryHandler(
+            LOG_FILE_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        ),
+        console_handler,
     ]
-)
+    log_queue: Queue = Queue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = QueueHandler(log_queue)
+    # Only merge msg/args here; the listener's handlers apply the real format
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    # force=True: replace any handler a library installed before us
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -51,9 +90,9 @@ def _emit_deferred_project_summaries(
     if not entries:
         return
     logger.info("")
-    logger.info("=" * 60)
+    logger.info(BANNER)
     logger.info("Per-project migration summaries")
-    logger.info("=" * 60)
+    logger.info(BANNER)
     for src, tgt, pst in sorted(entries, key=lambda x: x[0].lower()):
         logger.info("%s -> %s", src, tgt)
         for entity_type, count in pst.items():
@@ -76,8 +115,14 @@ def load_config(config_path: str) -> dict:
 
 
 def parse_args():
-    """Parse command line arguments - loads from config.json by default."""
+    """
+    Parse command line arguments - loads from config.json by default.
+
+    Returns:
+        Tuple of (parsed args, full config dict; empty if config.json is missing or invalid).
+    """
     config_path = 'config.json'
+    config = {}
     config_defaults = {}
     
     if Path(config_path).exists():
@@ -101,6 +146,7 @@ def parse_args():
                 'resume': options_config.get('resume', False),
             }
         except Exception as e:
+            config = {}
             logger.warning(f"Could not load config.json: {e}. Using command-line arguments only.")
     
     parser = argparse.ArgumentParser(
@@ -151,28 +197,20 @@ def parse_args():
     if not args.target_token:
         parser.error("--target-token is required (or provide config.json with target.api_token)")
     
-    return args
+    return args, config
 
 
 def main():
     """Main migration function."""
-    args = parse_args()
-    
-    # Load full config for user/group migration options
-    config_path = 'config.json'
-    config = {}
-    if Path(config_path).exists():
-        try:
-            config = load_config(config_path)
-        except Exception as e:
-            logger.warning(f"Could not load config.json: {e}")
+    # Full config is also needed for SCIM, user/group and options settings
+    args, config = parse_args()
     
-    logger.info("="*60)
+    logger.info(BANNER)
     logger.info("QASE WORKSPACE MIGRATION")
-    logger.info("="*60)
+    logger.info(BANNER)
     logger.info(f"Source: {args.source_host}")
     logger.info(f"Target: {args.target_host}")
-    logger.info("="*60)
+    logger.info(BANNER)
     
     # Get SCIM configuration
     source_config = config.get('source', {})
@@ -203,6 +241,12 @@ def main():
     stats = MigrationStats()
 
     opts = config.get("options", {}) if config else {}
+    try:
+        mappings.flush_interval = max(
+            0.0, float(opts.get("mappings_flush_interval", DEFAULT_MAPPINGS_FLUSH_INTERVAL))
+        )
+    except (TypeError, ValueError):
+        mappings.flush_interval = DEFAULT_MAPPINGS_FLUSH_INTERVAL
     trace_file_cfg = opts.get("migration_trace_file", "migration_trace.jsonl")
     if "migration_trace_file" in opts and opts["migration_trace_file"] in (False, None, ""):
         trace_file_cfg = None
@@ -224,54 +268,47 @@ def main():
         mappings.load_from_file(args.mappings_file)
     
     try:
-        logger.info("\n" + "="*60)
+        logger.info("\n" + BANNER)
         logger.info("STEP 1: Migrating Projects")
-        logger.info("="*60)
+        logger.info(BANNER)
         projects = migrate_projects(
             source_service, 
             target_service, 
             mappings, 
             stats,
-            only_projects=args.only_projects if args.only_projects else None
+            only_projects=args.only_projects if args.only_projects else None,
+            skip_projects=args.skip_projects if args.skip_projects else None
         )
         
-        if args.skip_projects:
-            projects = [p for p in projects if p['source_code'] not in args.skip_projects]
-        
         if not projects:
             logger.error("No projects to migrate!")
             return
         
         logger.info(f"Found {len(projects)} project(s) to migrate")
         
-        mappings.save_to_file(args.mappings_file)
+        mappings.maybe_flush(args.mappings_file)
         
         # Check if user migration is enabled
         users_config = config.get('users', {})
         migrate_users_flag = users_config.get('migrate', False)
         
         if migrate_users_flag:
-            logger.info("\n" + "="*60)
+            logger.info("\n" + BANNER)
             logger.info("STEP 2: Migrating Users (Workspace Level)")
-            logger.info("="*60)
+            logger.info(BANNER)
             try:
                 user_mapping = migrate_users(source_service, target_service, mappings, stats, config)
-                # Ensure user_mapping keys are integers (in case it was loaded from JSON with string keys)
-                if user_mapping:
-                    first_key = next(iter(user_mapping.keys()), None)
-                    if first_key is not None and isinstance(first_key, str):
-                        user_mapping = {int(k): v for k, v in user_mapping.items()}
-                mappings.save_to_file(args.mappings_file)
+                mappings.maybe_flush(args.mappings_file)
                 
-                logger.info("\n" + "="*60)
+                logger.info("\n" + BANNER)
                 logger.info("STEP 2.5: Migrating Groups (Workspace Level)")
-                logger.info("="*60)
+                logger.info(BANNER)
                 try:
                     group_mapping = migrate_groups(source_service, target_service, user_mapping, mappings, stats, config)
-                    mappings.save_to_file(args.mappings_file)
+                    mappings.maybe_flush(args.mappings_file)
                 except Exception as e:
                     logger.error(f"✗ Groups migration failed: {e}", exc_info=True)
-                    mappings.save_to_file(args.mappings_file)
+                    mappings.maybe_flush(args.mappings_file)
             except Exception as e:
                 logger.error(f"✗ User migration failed: {e}", exc_info=True)
                 # Create fallback mapping using default user ID
@@ -280,50 +317,53 @@ def main():
                 try:
                     source_users = extract_users(source_service)
                     default_user_id = users_config.get('default', 1)
-                    user_mapping = {user.get('id'): default_user_id for user in source_users if user.get('id')}
+                    user_mapping = dict.fromkeys(
+                        (user['id'] for user in source_users if user.get('id')),
+                        default_user_id,
+                    )
                     mappings.users = user_mapping
                     stats.add_entity('users', len(source_users), len(user_mapping))
                 except Exception as fallback_error:
                     logger.error(f"Failed to create fallback user mapping: {fallback_error}")
                     user_mapping = {}
-                mappings.save_to_file(args.mappings_file)
+                mappings.maybe_flush(args.mappings_file)
         else:
-            logger.info("\n" + "="*60)
+            logger.info("\n" + BANNER)
             logger.info("STEP 2: User Migration (SKIPPED - users.migrate: false)")
-            logger.info("="*60)
+            logger.info(BANNER)
             logger.info("User migration is disabled. Skipping user and group migration entirely.")
             # Create empty user mapping - will use default user ID (1) for all references
             user_mapping = {}
             mappings.users = user_mapping
-            mappings.save_to_file(args.mappings_file)
+            mappings.maybe_flush(args.mappings_file)
         
-        logger.info("\n" + "="*60)
+        logger.info("\n" + BANNER)
         logger.info("STEP 3: Migrating Custom Fields (Workspace Level)")
-        logger.info("="*60)
+        logger.info(BANNER)
         custom_field_mapping = migrate_custom_fields(
             source_service, target_service,
             mappings, stats
         )
-        mappings.save_to_file(args.mappings_file)
+        mappings.maybe_flush(args.mappings_file)
         
-        logger.info("\n" + "="*60)
+        logger.info("\n" + BANNER)
         logger.info("STEP 4: Migrating Shared Parameters (Workspace Level)")
-        logger.info("="*60)
+        logger.info(BANNER)
         project_codes_list = [p['source_code'] for p in projects]
         shared_parameter_mapping = migrate_shared_parameters(
             source_service, target_service,
             project_codes_list, mappings, stats
         )
-        mappings.save_to_file(args.mappings_file)
+        mappings.maybe_flush(args.mappings_file)
         
-        logger.info("\n" + "="*60)
+        logger.info("\n" + BANNER)
         logger.info("STEP 5: Migrating Attachments (Workspace Level)")
-        logger.info("="*60)
+        logger.info(BANNER)
         attachment_mapping = migrate_attachments_workspace(
             source_service, target_service,
             projects, mappings, stats
         )
-        mappings.save_to_file(args.mappings_file)
+        mappings.maybe_flush(args.mappings_file)
 
         parallel_projects = bool(opts.get("parallel_project_migration", True))
         try:
@@ -331,6 +371,11 @@ def main():
         except (TypeError, ValueError):
             max_parallel_projects = 4
         max_parallel_projects = min(max_parallel_projects, max(1, len(projects)))
+        parallel_project_steps = bool(opts.get("parallel_project_steps", True))
+        try:
+            case_create_workers = max(1, int(opts.get("case_create_workers", 1)))
+        except (TypeError, ValueError):
+            case_create_workers = 1
 
         show_project_progress = bool(opts.get("show_project_progress", True))
         use_project_progress_bars = show_project_progress and stderr_supports_progress()
@@ -363,7 +408,7 @@ def main():
             try:
                 src = QaseService(**source_kw)
                 tgt = QaseService(**target_kw)
-                wm = fork_mappings_for_parallel_project(mappings)
+                wm = fork_mappings_for_parallel_project(mappings, project["source_code"])
                 wstats = MigrationStats()
                 pst = run_single_project_migration(
                     project,
@@ -379,6 +424,8 @@ def main():
                     show_project_progress=use_project_progress_bars,
                     progress_position=bar_pos,
                     emit_summary_logs=False,
+                    parallel_steps=parallel_project_steps,
+                    case_create_workers=case_create_workers,
                 )
                 return project["source_code"], project["target_code"], wm, wstats, pst
             finally:
@@ -402,7 +449,7 @@ def main():
                         deferred_project_summaries.append((psrc, _ptgt, pst))
                         merge_parallel_project_into_main(mappings, wm, psrc)
                         merge_migration_stats(stats, wst)
-                        mappings.save_to_file(args.mappings_file)
+                        mappings.maybe_flush(args.mappings_file)
                     except Exception as e:
                         logger.error(
                             "✗ Project %s migration failed: %s",
@@ -429,6 +476,8 @@ def main():
                     show_project_progress=use_project_progress_bars,
                     progress_position=0,
                     emit_summary_logs=False,
+                    parallel_steps=parallel_project_steps,
+                    case_create_workers=case_create_workers,
                 )
                 deferred_project_summaries.append(
                     (project["source_code"], project["target_code"], pst)
@@ -1,22 +1,29 @@
 """
 Creation module - functions to create entities in target Qase workspace.
+
+Submodules are imported on first attribute access (PEP 562), so a run that
+never reaches e.g. defects or groups does not load them.
 """
-from migration.create.projects import migrate_projects
-from migration.create.users import migrate_users
-from migration.create.custom_fields import migrate_custom_fields
-from migration.create.shared_parameters import migrate_shared_parameters
-from migration.create.milestones import migrate_milestones
-from migration.create.configurations import migrate_configurations
-from migration.create.environments import migrate_environments
-from migration.create.shared_steps import migrate_shared_steps
-from migration.create.suites import migrate_suites
-from migration.create.cases import migrate_cases
-from migration.create.plans import migrate_plans
-from migration.create.runs import migrate_runs
-from migration.create.results import migrate_results
-from migration.create.defects import migrate_defects
-from migration.create.attachments import migrate_attachments_workspace
-from migration.create.groups import migrate_groups
+import importlib
+
+_LAZY = {
+    'migrate_projects': 'migration.create.projects',
+    'migrate_users': 'migration.create.users',
+    'migrate_custom_fields': 'migration.create.custom_fields',
+    'migrate_shared_parameters': 'migration.create.shared_parameters',
+    'migrate_milestones': 'migration.create.milestones',
+    'migrate_configurations': 'migration.create.configurations',
+    'migrate_environments': 'migration.create.environments',
+    'migrate_shared_steps': 'migration.create.shared_steps',
+    'migrate_suites': 'migration.create.suites',
+    'migrate_cases': 'migration.create.cases',
+    'migrate_plans': 'migration.create.plans',
+    'migrate_runs': 'migration.create.runs',
+    'migrate_results': 'migration.create.results',
+    'migrate_defects': 'migration.create.defects',
+    'migrate_attachments_workspace': 'migration.create.attachments',
+    'migrate_groups': 'migration.create.groups',
+}
 
 __all__ = [
     'migrate_projects',
@@ -36,3 +43,16 @@ __all__ = [
     'migrate_attachments_workspace',
     'migrate_groups',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,20 +5,23 @@ import logging
 import os
 import re
 import sys
+import tempfile
 import time
 import base64
 import threading
-import requests
 from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
-from typing import Dict, Set, List, Any, Optional, Tuple
+from typing import BinaryIO, Dict, Set, List, Any, Optional, Tuple, Union
 from tqdm import tqdm
 from qase.api_client_v1.api.attachments_api import AttachmentsApi
 from qase.api_client_v1.api.cases_api import CasesApi
 from qase.api_client_v1.exceptions import ApiException
 from qase_service import QaseService
-from migration.utils import MigrationMappings, MigrationStats, retry_with_backoff, extract_entities_from_response, to_dict
+from migration.utils import (
+    MigrationMappings, MigrationStats, retry_with_backoff, extract_entities_from_response, to_dict,
+    prefetch_iter,
+)
 from migration.extract.attachments import extract_all_attachment_hashes
 from migration.qase_rate_limit import QaseApiRateLimiter, exponential_backoff_delay
 
@@ -32,9 +35,64 @@ MAX_BYTES_PER_FILE = 32 * 1024 * 1024
 QASE_API_MAX_CALLS_PER_MINUTE = 1000
 DOWNLOAD_PARALLEL_WORKERS = min(24, max(8, (os.cpu_count() or 4) * 2))
 MAX_PARALLEL_TARGET_QUEUES = 4
+# Concurrent get_cases pages per target project in check_existing_attachments_in_target
+TARGET_CASE_PAGE_WORKERS = 4
 _BULK_UPLOAD_RETRIES = 12
 _ATTACHMENT_GET_MAX_RETRIES = 12
 _ATTACHMENT_GET_BASE_DELAY = 1.5
+# Attachment hash in a case attachment URL; workspace hash in an uploaded file URL
+_ATT_URL_RE = re.compile(r'/attachment/([a-f0-9]{32,64})/', re.IGNORECASE)
+_WORKSPACE_HASH_RE = re.compile(r'/public/team/([a-f0-9]{32,64})/', re.IGNORECASE)
+# Cheap prefix check before base64-decoding an inline ``file`` string
+_looks_b64 = re.compile(r'^[A-Za-z0-9+/=\s]+$').match
+# URL downloads are streamed into a spooled temp file: kept in memory up to this
+# size, then on disk, so queued files awaiting upload do not all sit in RAM.
+DOWNLOAD_SPOOL_MAX_MEMORY = 1 << 20
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Downloaded attachment body: bytes (SDK base64 payload) or a spooled file
+AttachmentContent = Union[bytes, BinaryIO]
+
+
+def _content_size(content: AttachmentContent) -> int:
+    if isinstance(content, bytes):
+        return len(content)
+    size = content.seek(0, os.SEEK_END)
+    content.seek(0)
+    return size
+
+
+def _close_content(content: AttachmentContent) -> None:
+    if not isinstance(content, bytes):
+        content.close()
+
+
+def _get_spooled(
+    source_service: QaseService,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Tuple[int, Optional[BinaryIO]]:
+    """
+    Stream a GET body into a spooled temp file.
+
+    Returns:
+        (status code, file rewound to 0) — file is None unless status is 200 and the body is non-empty
+    """
+    with source_service.http.get(url, headers=headers, stream=True, timeout=60) as r:
+        if r.status_code != 200:
+            return r.status_code, None
+        spool = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_MEMORY)
+        try:
+            for chunk in r.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                spool.write(chunk)
+        except Exception:
+            spool.close()
+            raise
+        if not spool.tell():
+            spool.close()
+            return r.status_code, None
+        spool.seek(0)
+        return r.status_code, spool
 
 
 def _try_download_markdown_url(
@@ -42,7 +100,7 @@ def _try_download_markdown_url(
     attachment_hash: str,
     source_service: QaseService,
     filename_hint: Optional[str] = None,
-) -> Tuple[Optional[bytes], Optional[str]]:
+) -> Tuple[Optional[AttachmentContent], Optional[str]]:
     """HTTP-only download from a known attachment URL (safe for parallel use)."""
     filename = filename_hint
     if not filename:
@@ -51,21 +109,15 @@ def _try_download_markdown_url(
         if url_filename and url_filename != "/":
             filename = url_filename
     try:
-        url_response = requests.get(markdown_url, timeout=60)
-        if url_response.status_code == 200:
-            content = url_response.content
+        status, content = _get_spooled(source_service, markdown_url)
+        if status == 403:
+            headers = {"Token": source_service.api_token}
+            status, content = _get_spooled(source_service, markdown_url, headers=headers)
+        if status == 200:
             if not filename:
                 parsed = urlparse(markdown_url)
                 filename = os.path.basename(parsed.path) or f"attachment_{attachment_hash[:8]}.bin"
             return content, filename
-        if url_response.status_code == 403:
-            headers = {"Token": source_service.api_token}
-            url_response = requests.get(markdown_url, headers=headers, timeout=60)
-            if url_response.status_code == 200:
-                if not filename:
-                    parsed = urlparse(markdown_url)
-                    filename = os.path.basename(parsed.path) or f"attachment_{attachment_hash[:8]}.bin"
-                return url_response.content, filename
     except Exception:
         pass
     return None, None
@@ -83,10 +135,8 @@ def _parse_hashes_from_upload_json(data: Any, expected_n: int) -> List[Optional[
         for item in result:
             if isinstance(item, dict):
                 out.append(item.get("hash"))
-            elif hasattr(item, "hash"):
-                out.append(getattr(item, "hash", None))
             else:
-                out.append(None)
+                out.append(getattr(item, "hash", None))
         return out
     if isinstance(result, dict):
         if "hash" in result:
@@ -109,7 +159,7 @@ def _maybe_capture_workspace_hash_from_upload_result(mappings: MigrationMappings
                 scan(v)
             u = obj.get("url") or obj.get("full_path")
             if isinstance(u, str):
-                m = re.search(r"/public/team/([a-f0-9]{32,64})/", u, re.IGNORECASE)
+                m = _WORKSPACE_HASH_RE.search(u)
                 if m:
                     mappings.target_workspace_hash = m.group(1)
         elif isinstance(obj, list):
@@ -122,7 +172,7 @@ def _maybe_capture_workspace_hash_from_upload_result(mappings: MigrationMappings
 def _upload_files_http(
     target_service: QaseService,
     project_code: str,
-    named_files: List[Tuple[str, bytes]],
+    named_files: List[Tuple[str, AttachmentContent]],
     mappings: MigrationMappings,
     target_api_limiter: Optional[QaseApiRateLimiter] = None,
 ) -> List[Optional[str]]:
@@ -145,7 +195,10 @@ def _upload_files_http(
         try:
             if target_api_limiter:
                 target_api_limiter.acquire(1)
-            r = requests.post(url, headers=headers, files=multipart, timeout=300)
+            for _fn, content in named_files:
+                if not isinstance(content, bytes):
+                    content.seek(0)
+            r = target_service.http.post(url, headers=headers, files=multipart, timeout=300)
             if r.status_code == 507:
                 logger.error("Attachment upload failed: insufficient storage (507) for project %s", project_code)
                 return [None] * n
@@ -185,27 +238,28 @@ def _upload_files_http(
     return [None] * n
 
 
-def _take_upload_batch(ready: deque) -> List[Tuple[str, str, bytes]]:
+def _take_upload_batch(ready: deque) -> List[Tuple[str, str, AttachmentContent]]:
     """Greedy batch: max 20 files, max 128 MiB total; oversized files (>32 MiB) upload alone."""
     if not ready:
         return []
     first = ready[0]
-    _, _, first_bytes = first
-    if len(first_bytes) > MAX_BYTES_PER_FILE:
+    _, _, first_content = first
+    if _content_size(first_content) > MAX_BYTES_PER_FILE:
         ready.popleft()
         return [first]
-    batch: List[Tuple[str, str, bytes]] = []
+    batch: List[Tuple[str, str, AttachmentContent]] = []
     total = 0
     while ready:
         h, fn, c = ready[0]
-        if len(c) > MAX_BYTES_PER_FILE:
+        size = _content_size(c)
+        if size > MAX_BYTES_PER_FILE:
             break
         if len(batch) >= MAX_FILES_PER_UPLOAD:
             break
-        if total + len(c) > MAX_BYTES_PER_UPLOAD and batch:
+        if total + size > MAX_BYTES_PER_UPLOAD and batch:
             break
         batch.append(ready.popleft())
-        total += len(c)
+        total += size
     return batch
 
 
@@ -224,7 +278,7 @@ def _log_source_attachment_library_totals(
         try:
             if source_api_limiter:
                 source_api_limiter.acquire(1)
-            r = requests.get(
+            r = source_service.http.get(
                 f"{base}/attachment/{code}",
                 headers=headers,
                 params={"limit": 1, "offset": 0},
@@ -246,77 +300,148 @@ def _log_source_attachment_library_totals(
             pass
 
 
+def _add_case_attachment_hashes(cases_entities: List[Any], existing_attachments: Set[str]) -> None:
+    """Add (lowercased) attachment hashes of one page of target cases."""
+    for case in cases_entities:
+        # Read attachments off the model; serializing the whole case is only a fallback
+        if isinstance(case, dict):
+            attachments = case.get('attachments')
+        elif hasattr(case, 'attachments'):
+            attachments = case.attachments
+        else:
+            attachments = to_dict(case).get('attachments')
+        
+        if attachments:
+            for att_item in attachments:
+                att_hash = None
+                if isinstance(att_item, str):
+                    att_hash = att_item
+                else:
+                    if not isinstance(att_item, dict):
+                        att_item = to_dict(att_item)
+                    if 'hash' in att_item:
+                        att_hash = att_item['hash']
+                    elif isinstance(att_item.get('url'), str):
+                        match = _ATT_URL_RE.search(att_item['url'])
+                        if match:
+                            att_hash = match.group(1)
+                if att_hash:
+                    existing_attachments.add(att_hash.lower())
+
+
+def _list_hashes_for_project(
+    target_service: QaseService,
+    project_code_target: str,
+    target_api_limiter: Optional[QaseApiRateLimiter] = None,
+) -> Set[str]:
+    """
+    Collect (lowercased) case attachment hashes already present in one target project.
+
+    The first page's ``result.total`` sizes the project; remaining pages are fetched
+    concurrently, each page worker on its own clone of ``target_service`` (SDK
+    clients are not shared across threads). Without a total, pages are walked
+    sequentially.
+
+    A page that still fails after retries raises: a partial set would make the
+    unread pages' attachments look absent and get them uploaded a second time.
+    """
+    existing_attachments: Set[str] = set()
+    limit = 100
+    cases_api_target = CasesApi(target_service.client)
+
+    def _get_cases_page(offset: int, cases_api_target: CasesApi = cases_api_target):
+        def _do_get():
+            if target_api_limiter:
+                target_api_limiter.acquire(1)
+            return cases_api_target.get_cases(
+                code=project_code_target,
+                limit=limit,
+                offset=offset,
+            )
+
+        return retry_with_backoff(
+            _do_get,
+            max_retries=8,
+            base_delay=_ATTACHMENT_GET_BASE_DELAY,
+        )
+
+    first_response = _get_cases_page(0)
+    cases_entities = extract_entities_from_response(first_response)
+    if not cases_entities:
+        return existing_attachments
+    _add_case_attachment_hashes(cases_entities, existing_attachments)
+    if len(cases_entities) < limit:
+        return existing_attachments
+
+    total = getattr(getattr(first_response, 'result', None), 'total', None)
+    if isinstance(total, int):
+        offsets = range(limit, total, limit)
+        if not offsets:
+            return existing_attachments
+
+        worker_state = threading.local()
+        worker_services: List[QaseService] = []
+        worker_services_lock = threading.Lock()
+
+        def _page_entities(offset: int) -> List[Any]:
+            worker_api = getattr(worker_state, 'cases_api', None)
+            if worker_api is None:
+                worker_service = target_service.clone()
+                with worker_services_lock:
+                    worker_services.append(worker_service)
+                worker_api = worker_state.cases_api = CasesApi(worker_service.client)
+            return extract_entities_from_response(_get_cases_page(offset, worker_api)) or []
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(TARGET_CASE_PAGE_WORKERS, len(offsets))) as pool:
+                for page_entities in pool.map(_page_entities, offsets):
+                    _add_case_attachment_hashes(page_entities, existing_attachments)
+        finally:
+            for worker_service in worker_services:
+                worker_service.close()
+        return existing_attachments
+
+    offset = limit
+    while True:
+        cases_entities = extract_entities_from_response(_get_cases_page(offset))
+        if not cases_entities:
+            break
+        _add_case_attachment_hashes(cases_entities, existing_attachments)
+        if len(cases_entities) < limit:
+            break
+        offset += limit
+
+    return existing_attachments
+
+
 def check_existing_attachments_in_target(
     target_service: QaseService,
     projects: List[Dict[str, Any]],
     target_api_limiter: Optional[QaseApiRateLimiter] = None,
 ) -> Set[str]:
     """
-    Check for existing attachments in target workspace.
+    Check for existing attachments in target workspace (target projects are paged concurrently).
     
     Returns:
         Set of existing attachment hashes
     """
-    attachments_api_target = AttachmentsApi(target_service.client)
-    cases_api_target = CasesApi(target_service.client)
-    existing_attachments = set()
-    
-    for project in projects:
-        project_code_target = project['target_code']
-        try:
-            offset = 0
-            limit = 100
-            
-            while True:
-                try:
+    target_codes = [project['target_code'] for project in projects]
+    if not target_codes:
+        return set()
 
-                    def _get_cases_page():
-                        if target_api_limiter:
-                            target_api_limiter.acquire(1)
-                        return cases_api_target.get_cases(
-                            code=project_code_target,
-                            limit=limit,
-                            offset=offset,
-                        )
+    def _list_project(project_code_target: str) -> Set[str]:
+        # One client per project worker; errors propagate (no partial sets)
+        worker_service = target_service.clone()
+        try:
+            return _list_hashes_for_project(
+                worker_service, project_code_target, target_api_limiter
+            )
+        finally:
+            worker_service.close()
 
-                    cases_response = retry_with_backoff(
-                        _get_cases_page,
-                        max_retries=8,
-                        base_delay=_ATTACHMENT_GET_BASE_DELAY,
-                    )
-                    
-                    cases_entities = extract_entities_from_response(cases_response)
-                    if not cases_entities:
-                        break
-                    
-                    for case in cases_entities:
-                        case_dict = to_dict(case)
-                        
-                        if case_dict.get('attachments'):
-                            for att_item in case_dict['attachments']:
-                                att_hash = None
-                                if isinstance(att_item, str):
-                                    att_hash = att_item
-                                elif isinstance(att_item, dict):
-                                    if 'hash' in att_item:
-                                        att_hash = att_item['hash']
-                                    elif 'url' in att_item:
-                                        url = att_item['url']
-                                        match = re.search(r'/attachment/([a-f0-9]{32,64})/', url, re.IGNORECASE)
-                                        if match:
-                                            att_hash = match.group(1)
-                                if att_hash:
-                                    existing_attachments.add(att_hash.lower())
-                    
-                    if len(cases_entities) < limit:
-                        break
-                    offset += limit
-                except Exception as e:
-                    break
-        except Exception as e:
-            pass
-    
-    return existing_attachments
+    workers = min(8, len(target_codes))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return set().union(*pool.map(_list_project, target_codes))
 
 
 def download_attachment(
@@ -327,7 +452,7 @@ def download_attachment(
     *,
     source_api_limiter: Optional[QaseApiRateLimiter] = None,
     client_lock: Optional[threading.Lock] = None,
-) -> Tuple[Optional[bytes], Optional[str]]:
+) -> Tuple[Optional[AttachmentContent], Optional[str]]:
     """
     Download attachment content and extract filename.
 
@@ -387,68 +512,56 @@ def download_attachment(
             download_response = None
             break
 
-    if download_response and hasattr(download_response, 'status') and download_response.status:
-        if hasattr(download_response, 'result') and download_response.result:
-            attachment_obj = download_response.result
-            
-            # Try to get file content from 'file' field
-            if hasattr(attachment_obj, 'file') and attachment_obj.file is not None:
-                if isinstance(attachment_obj.file, bytes):
-                    file_content = attachment_obj.file
-                elif isinstance(attachment_obj.file, str):
-                    try:
-                        file_content = base64.b64decode(attachment_obj.file)
-                    except Exception:
-                        pass
-            
-            if not filename:
-                if hasattr(attachment_obj, 'filename') and attachment_obj.filename:
-                    filename = attachment_obj.filename
-                elif hasattr(attachment_obj, 'full_path') and attachment_obj.full_path:
-                    filename = os.path.basename(attachment_obj.full_path)
-                elif hasattr(attachment_obj, 'extension') and attachment_obj.extension:
-                    filename = f"attachment_{attachment_hash[:8]}.{attachment_obj.extension}"
+    attachment_obj = (
+        getattr(download_response, 'result', None)
+        if getattr(download_response, 'status', None)
+        else None
+    )
+    if attachment_obj:
+        # Try to get file content from 'file' field
+        file_field = getattr(attachment_obj, 'file', None)
+        if isinstance(file_field, bytes):
+            file_content = file_field
+        elif isinstance(file_field, str) and _looks_b64(file_field[:64]):
+            try:
+                file_content = base64.b64decode(file_field, validate=False)
+            except Exception:
+                pass
+        
+        full_path = getattr(attachment_obj, 'full_path', None)
+        if not filename:
+            attachment_filename = getattr(attachment_obj, 'filename', None)
+            extension = getattr(attachment_obj, 'extension', None)
+            if attachment_filename:
+                filename = attachment_filename
+            elif full_path:
+                filename = os.path.basename(full_path)
+            elif extension:
+                filename = f"attachment_{attachment_hash[:8]}.{extension}"
+        
+        if not file_content:
+            url_to_download = getattr(attachment_obj, 'url', None) or full_path
             
-            if not file_content:
-                url_to_download = None
-                if hasattr(attachment_obj, 'url'):
-                    url_value = getattr(attachment_obj, 'url', None)
-                    if url_value:
-                        url_to_download = url_value
-                if not url_to_download and hasattr(attachment_obj, 'full_path'):
-                    full_path_value = getattr(attachment_obj, 'full_path', None)
-                    if full_path_value:
-                        url_to_download = full_path_value
-                
-                if url_to_download:
-                    try:
-                        url_response = requests.get(url_to_download, timeout=60)
-                        if url_response.status_code == 200:
-                            file_content = url_response.content
-                        elif url_response.status_code == 403:
-                            headers = {'Token': source_service.api_token}
-                            url_response = requests.get(url_to_download, headers=headers, timeout=60)
-                            if url_response.status_code == 200:
-                                file_content = url_response.content
-                    except Exception as e:
-                        pass
+            if url_to_download:
+                try:
+                    status, file_content = _get_spooled(source_service, url_to_download)
+                    if status == 403:
+                        headers = {'Token': source_service.api_token}
+                        status, file_content = _get_spooled(
+                            source_service, url_to_download, headers=headers
+                        )
+                except Exception as e:
+                    pass
     
     if not file_content and markdown_url:
         try:
-            url_response = requests.get(markdown_url, timeout=60)
-            if url_response.status_code == 200:
-                file_content = url_response.content
-                if not filename:
-                    parsed = urlparse(markdown_url)
-                    filename = os.path.basename(parsed.path) or f"attachment_{attachment_hash[:8]}.bin"
-            elif url_response.status_code == 403:
+            status, file_content = _get_spooled(source_service, markdown_url)
+            if status == 403:
                 headers = {'Token': source_service.api_token}
-                url_response = requests.get(markdown_url, headers=headers, timeout=60)
-                if url_response.status_code == 200:
-                    file_content = url_response.content
-                    if not filename:
-                        parsed = urlparse(markdown_url)
-                        filename = os.path.basename(parsed.path) or f"attachment_{attachment_hash[:8]}.bin"
+                status, file_content = _get_spooled(source_service, markdown_url, headers=headers)
+            if file_content and not filename:
+                parsed = urlparse(markdown_url)
+                filename = os.path.basename(parsed.path) or f"attachment_{attachment_hash[:8]}.bin"
         except Exception as e:
             pass
     
@@ -462,7 +575,7 @@ def upload_attachment(
     target_service: QaseService,
     project_code_target: str,
     filename: str,
-    file_content: bytes,
+    file_content: AttachmentContent,
     mappings: MigrationMappings,
     target_api_limiter: Optional[QaseApiRateLimiter] = None,
 ) -> Optional[str]:
@@ -489,7 +602,7 @@ def _download_single_for_migration(
     source_service: QaseService,
     sdk_lock: threading.Lock,
     source_api_limiter: Optional[QaseApiRateLimiter] = None,
-) -> Tuple[str, Optional[bytes], Optional[str]]:
+) -> Tuple[str, Optional[AttachmentContent], Optional[str]]:
     """Try public URL first (parallel-friendly), then SDK get_attachment (throttled, short lock)."""
     if markdown_url:
         content, filename = _try_download_markdown_url(
@@ -514,10 +627,10 @@ def _download_batch_parallel(
     source_service: QaseService,
     sdk_lock: threading.Lock,
     source_api_limiter: Optional[QaseApiRateLimiter] = None,
-) -> List[Tuple[str, str, bytes]]:
+) -> List[Tuple[str, str, AttachmentContent]]:
     if not batch:
         return []
-    out: List[Tuple[str, str, bytes]] = []
+    out: List[Tuple[str, str, AttachmentContent]] = []
     if len(batch) == 1:
         h, url = batch[0]
         _, content, filename = _download_single_for_migration(
@@ -574,10 +687,6 @@ def migrate_attachments_workspace(
     source_api_limiter = QaseApiRateLimiter(QASE_API_MAX_CALLS_PER_MINUTE, 60.0)
     target_api_limiter = QaseApiRateLimiter(QASE_API_MAX_CALLS_PER_MINUTE, 60.0)
 
-    existing_attachments = check_existing_attachments_in_target(
-        target_service, projects, target_api_limiter=target_api_limiter
-    )
-
     all_project_attachments = extract_all_attachment_hashes(source_service, projects)
 
     global_attachment_set = set()
@@ -586,8 +695,9 @@ def migrate_attachments_workspace(
 
     for project_code_source, (hashes, urls) in all_project_attachments.items():
         all_attachments[project_code_source] = hashes
-        global_attachment_set.update(hashes)
-        attachment_urls.update(urls)
+        # Normalize once here; the loops below compare lowercased hashes only
+        global_attachment_set.update(str(h).lower() for h in hashes)
+        attachment_urls.update((str(h).lower(), u) for h, u in urls.items())
 
     total_unique_attachments = len(global_attachment_set)
 
@@ -603,23 +713,32 @@ def migrate_attachments_workspace(
     upload_queues: Dict[str, deque] = defaultdict(deque)
     work_total = 0
 
-    for attachment_hash_raw in global_attachment_set:
-        attachment_hash = str(attachment_hash_raw).lower()
-
-        already_mapped = False
-        for project_code in mappings.attachments:
-            if attachment_hash in mappings.attachments[project_code]:
-                global_attachment_mapping[attachment_hash] = mappings.attachments[project_code][attachment_hash]
-                skipped_already_migrated_count += 1
-                already_mapped = True
-                break
-            if attachment_hash_raw in mappings.attachments[project_code]:
-                global_attachment_mapping[attachment_hash] = mappings.attachments[project_code][attachment_hash_raw]
-                skipped_already_migrated_count += 1
-                already_mapped = True
-                break
+    # Owning (source, target) project per hash; first project in list order wins
+    hash_to_project: Dict[str, Tuple[str, str]] = {}
+    for project in projects:
+        for h in all_attachments.get(project["source_code"], ()):
+            hash_to_project.setdefault(str(h).lower(), (project["source_code"], project["target_code"]))
+
+    # Hashes migrated on a previous run (any project), keyed by lowercased source hash;
+    # the first project to have mapped a hash wins, as with the per-project scan.
+    flat_map: Dict[str, str] = {}
+    for project_attachments in mappings.attachments.values():
+        for mapped_hash, mapped_target in project_attachments.items():
+            flat_map.setdefault(str(mapped_hash).lower(), mapped_target)
+
+    # Paging every target case is only needed for hashes no earlier run has mapped;
+    # on a resumed migration that is often none of them.
+    if any(h not in flat_map for h in global_attachment_set):
+        existing_attachments = check_existing_attachments_in_target(
+            target_service, projects, target_api_limiter=target_api_limiter
+        )
+    else:
+        existing_attachments = set()
 
-        if already_mapped:
+    for attachment_hash in global_attachment_set:
+        if attachment_hash in flat_map:
+            global_attachment_mapping[attachment_hash] = flat_map[attachment_hash]
+            skipped_already_migrated_count += 1
             continue
 
         if attachment_hash in existing_attachments:
@@ -627,16 +746,10 @@ def migrate_attachments_workspace(
             skipped_existing_count += 1
             continue
 
-        source_project = None
-        target_project = None
-        for project in projects:
-            project_code_source = project["source_code"]
-            if project_code_source in all_attachments:
-                if attachment_hash in all_attachments[project_code_source]:
-                    source_project = project_code_source
-                    target_project = project["target_code"]
-                    break
-
+        entry = hash_to_project.get(attachment_hash)
+        if not entry:
+            continue
+        source_project, target_project = entry
         if not source_project or not target_project:
             continue
 
@@ -659,68 +772,80 @@ def migrate_attachments_workspace(
         with pbar_lock:
             pbar.update(n)
 
-    def drain_target_queue(target_code: str) -> int:
-        local_migrated = 0
+    def _download_batches(target_code: str):
+        """Yield downloaded (hash, filename, content) lists, MAX_FILES_PER_UPLOAD hashes at a time."""
         q = upload_queues[target_code]
-        ready: deque = deque()
-        while q or ready:
-            while len(ready) < MAX_FILES_PER_UPLOAD * 3 and q:
-                download_batch: List[Tuple[str, Optional[str]]] = []
-                while len(download_batch) < MAX_FILES_PER_UPLOAD and q:
-                    download_batch.append(q.popleft())
-                downloaded = _download_batch_parallel(
-                    download_batch,
-                    attachments_api_source,
-                    source_service,
-                    sdk_lock,
-                    source_api_limiter,
-                )
-                ok_hashes = {t[0] for t in downloaded}
-                for h, _url in download_batch:
-                    if h not in ok_hashes:
-                        _pbar_update(1)
-                for triple in downloaded:
-                    ready.append(triple)
-            if not ready:
-                break
-            upload_batch = _take_upload_batch(ready)
-            if not upload_batch:
-                continue
-            named_files = [(fn, content) for _h, fn, content in upload_batch]
-            target_hashes = _upload_files_http(
-                target_service,
-                target_code,
-                named_files,
-                mappings,
-                target_api_limiter=target_api_limiter,
+        while q:
+            download_batch: List[Tuple[str, Optional[str]]] = []
+            while len(download_batch) < MAX_FILES_PER_UPLOAD and q:
+                download_batch.append(q.popleft())
+            downloaded = _download_batch_parallel(
+                download_batch,
+                attachments_api_source,
+                source_service,
+                sdk_lock,
+                source_api_limiter,
             )
-            if (
-                len(upload_batch) > 1
-                and target_hashes
-                and all(th is None for th in target_hashes)
-            ):
-                for src_hash, fn, content in upload_batch:
-                    th = _upload_files_http(
-                        target_service,
-                        target_code,
-                        [(fn, content)],
-                        mappings,
-                        target_api_limiter=target_api_limiter,
-                    )
-                    mapped = th[0] if th else None
-                    if mapped:
-                        with mapping_lock:
-                            global_attachment_mapping[src_hash] = mapped
-                        local_migrated += 1
+            ok_hashes = {t[0] for t in downloaded}
+            for h, _url in download_batch:
+                if h not in ok_hashes:
                     _pbar_update(1)
-                continue
-            for i, (src_hash, _fn, _c) in enumerate(upload_batch):
-                th = target_hashes[i] if i < len(target_hashes) else None
-                if th:
+            yield downloaded
+
+    def _upload_batch(target_code: str, upload_batch: List[Tuple[str, str, AttachmentContent]]) -> int:
+        local_migrated = 0
+        named_files = [(fn, content) for _h, fn, content in upload_batch]
+        target_hashes = _upload_files_http(
+            target_service,
+            target_code,
+            named_files,
+            mappings,
+            target_api_limiter=target_api_limiter,
+        )
+        if (
+            len(upload_batch) > 1
+            and target_hashes
+            and all(th is None for th in target_hashes)
+        ):
+            for src_hash, fn, content in upload_batch:
+                th = _upload_files_http(
+                    target_service,
+                    target_code,
+                    [(fn, content)],
+                    mappings,
+                    target_api_limiter=target_api_limiter,
+                )
+                mapped = th[0] if th else None
+                if mapped:
                     with mapping_lock:
-                        global_attachment_mapping[src_hash] = th
+                        global_attachment_mapping[src_hash] = mapped
                     local_migrated += 1
                 _pbar_update(1)
+                _close_content(content)
+            return local_migrated
+        for i, (src_hash, _fn, content) in enumerate(upload_batch):
+            th = target_hashes[i] if i < len(target_hashes) else None
+            if th:
+                with mapping_lock:
+                    global_attachment_mapping[src_hash] = th
+                local_migrated += 1
+            _pbar_update(1)
+            _close_content(content)
+        return local_migrated
+
+    def drain_target_queue(target_code: str) -> int:
+        """
+        Download on a background thread (up to two batches ahead) while uploading
+        full batches here, so source and target requests overlap.
+        """
+        local_migrated = 0
+        ready: deque = deque()
+        for downloaded in prefetch_iter(_download_batches(target_code), depth=2):
+            ready.extend(downloaded)
+            while len(ready) >= MAX_FILES_PER_UPLOAD:
+                local_migrated += _upload_batch(target_code, _take_upload_batch(ready))
+        while ready:
+            local_migrated += _upload_batch(target_code, _take_upload_batch(ready))
         return local_migrated
 
     try:
@@ -745,11 +870,10 @@ def migrate_attachments_workspace(
         if project_code_source in all_attachments:
             for attachment_hash in all_attachments[project_code_source]:
                 normalized_hash = attachment_hash.lower()
-                target_hash = global_attachment_mapping.get(normalized_hash) or global_attachment_mapping.get(attachment_hash)
+                # global_attachment_mapping is keyed by lowercased hash only
+                target_hash = global_attachment_mapping.get(normalized_hash)
                 if target_hash:
                     mappings.attachments[project_code_source][normalized_hash] = target_hash
-                    if normalized_hash != attachment_hash:
-                        mappings.attachments[project_code_source][attachment_hash] = target_hash
     
     stats.add_entity('attachments', total_unique_attachments, migrated_count)
     
@@ -3,19 +3,74 @@ Create cases in target Qase workspace.
 """
 import logging
 import re
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Callable, Dict, Any, Optional, TYPE_CHECKING
 from qase_service import QaseService
 
 if TYPE_CHECKING:
     from migration.progress import ProjectMigrationProgress
 from migration.utils import (
-    MigrationMappings, MigrationStats, to_dict, preserve_or_hash_id,
-    QaseRawApiClient
+    MigrationMappings, MigrationStats, to_dict, preserve_or_hash_id, MAX_SAFE_ID,
+    QaseRawApiClient, prefetch_iter
 )
 from migration.transform.attachments import replace_attachment_hashes_in_text
 
 logger = logging.getLogger(__name__)
 
+# Default bulk case creates kept in flight while later pages are transformed.
+# One keeps target case order (and auto-assigned ids) the same as the source.
+CASE_CREATE_WORKERS = 1
+
+_ATT_URL_RE = re.compile(r'/attachment/([a-f0-9]{32,64})/', re.IGNORECASE)
+_HEX_CHARS = frozenset('0123456789abcdefABCDEF')
+
+
+def _attachment_hash_from_url(url: str) -> Optional[str]:
+    """Hash from a .../attachment/{hash}/... URL; plain string split, regex only as fallback."""
+    _, sep, tail = url.partition('/attachment/')
+    if sep:
+        candidate, slash, _ = tail.partition('/')
+        if slash and 32 <= len(candidate) <= 64 and _HEX_CHARS.issuperset(candidate):
+            return candidate
+    match = _ATT_URL_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _iso(value: Any) -> Optional[str]:
+    """ISO string for a date/datetime, non-empty strings as-is, else None."""
+    if isinstance(value, str):
+        return value or None
+    if isinstance(value, date):
+        return value.isoformat()
+    return None
+
+
+def make_author_resolver(mappings: MigrationMappings) -> Callable[[Dict[str, Any]], int]:
+    """
+    Build a case -> target author id resolver for one project.
+    
+    Author is taken from member_id (same as user_id for runs), then created_by,
+    then author_id, and mapped with ``mappings.get_user_id`` (which owns the
+    fallback for missing, unknown or unparsable ids). Results are memoized per
+    raw source value.
+    """
+    cache: Dict[Any, int] = {}
+    
+    def resolve(case_dict: Dict[str, Any]) -> int:
+        source_user_id = case_dict.get('member_id') or case_dict.get('created_by') or case_dict.get('author_id')
+        target_author_id = cache.get(source_user_id)
+        if target_author_id is None:
+            try:
+                lookup_id = int(source_user_id)
+            except (ValueError, TypeError):
+                lookup_id = source_user_id
+            target_author_id = cache[source_user_id] = mappings.get_user_id(lookup_id)
+        return target_author_id
+    
+    return resolve
+
 
 def transform_case_data(
     case_dict: Dict[str, Any],
@@ -27,7 +82,9 @@ def transform_case_data(
     user_mapping: Dict[int, int],
     attachment_mapping: Dict[str, str],
     mappings: MigrationMappings,
-    preserve_ids: bool = True
+    preserve_ids: bool = True,
+    target_workspace_hash: Optional[str] = None,
+    resolve_author: Optional[Callable[[Dict[str, Any]], int]] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Transform a case dictionary from source format to target format.
@@ -42,48 +99,33 @@ def transform_case_data(
         target_suite_id = suite_mapping.get(source_suite_id)
     
     case_id = case_dict.get('id')
-    if case_id and preserve_ids:
+    # preserve_or_hash_id only changes ids above int32 when preserving
+    if case_id and preserve_ids and case_id > MAX_SAFE_ID:
         case_id = preserve_or_hash_id(case_id, preserve_ids)
     
-    tags_list = case_dict.get('tags', [])
-    processed_tags = []
-    for tag in tags_list:
-        if isinstance(tag, dict):
-            tag_title = tag.get('title') or tag.get('name') or str(tag)
-            processed_tags.append(tag_title)
-        elif isinstance(tag, str):
-            processed_tags.append(tag)
-        else:
-            processed_tags.append(str(tag))
-    
-    created_at = case_dict.get('created_at')
-    if created_at and hasattr(created_at, 'isoformat'):
-        created_at = created_at.isoformat()
-    elif created_at and isinstance(created_at, str):
-        pass  # Already a string
+    tags_list = case_dict.get('tags') or []
+    if all(type(tag) is str for tag in tags_list):
+        # Common case: plain tag titles, nothing to convert
+        processed_tags = list(tags_list)
     else:
-        created_at = None
+        processed_tags = []
+        for tag in tags_list:
+            if isinstance(tag, dict):
+                tag_title = tag.get('title') or tag.get('name') or str(tag)
+                processed_tags.append(tag_title)
+            elif isinstance(tag, str):
+                processed_tags.append(tag)
+            else:
+                processed_tags.append(str(tag))
     
-    updated_at = case_dict.get('updated_at')
-    if updated_at and hasattr(updated_at, 'isoformat'):
-        updated_at = updated_at.isoformat()
-    elif updated_at and isinstance(updated_at, str):
-        pass  # Already a string
-    else:
-        updated_at = None
+    created_at = _iso(case_dict.get('created_at'))
+    updated_at = _iso(case_dict.get('updated_at'))
     
-    # Map author_id from member_id (same as user_id for runs)
-    source_user_id = case_dict.get('member_id') or case_dict.get('created_by') or case_dict.get('author_id')
-    target_author_id = 1
-    if source_user_id:
-        try:
-            source_user_id_int = int(source_user_id)
-            if source_user_id_int == 0:
-                target_author_id = 1
-            else:
-                target_author_id = mappings.get_user_id(source_user_id_int)
-        except (ValueError, TypeError):
-            target_author_id = 1
+    if resolve_author is None:
+        resolve_author = make_author_resolver(mappings)
+    target_author_id = resolve_author(case_dict)
+    
+    source_milestone_id = case_dict.get('milestone_id')
     
     case_data = {
         'title': case_dict.get('title', ''),
@@ -100,7 +142,7 @@ def transform_case_data(
         'created_at': created_at,
         'updated_at': updated_at,
         'author_id': target_author_id,
-        'milestone_id': milestone_mapping.get(case_dict.get('milestone_id')) if case_dict.get('milestone_id') else None,
+        'milestone_id': milestone_mapping.get(source_milestone_id) if source_milestone_id else None,
         'attachments': [],
         'is_flaky': case_dict.get('is_flaky', 0),
         'custom_field': {}
@@ -127,13 +169,8 @@ def transform_case_data(
                 # Map shared parameter ID if it exists
                 target_shared_id = None
                 if source_shared_id:
-                    # Convert to string for consistent lookup
-                    source_shared_id_str = str(source_shared_id)
-                    if source_shared_id_str in shared_parameter_mapping:
-                        target_shared_id = shared_parameter_mapping[source_shared_id_str]
-                    # Also try original format
-                    elif source_shared_id in shared_parameter_mapping:
-                        target_shared_id = shared_parameter_mapping[source_shared_id]
+                    # Mapping keys are normalized to str in migrate_cases
+                    target_shared_id = shared_parameter_mapping.get(str(source_shared_id))
                 
                 # Shared parameter reference
                 if target_shared_id:
@@ -176,7 +213,6 @@ def transform_case_data(
         
         if parameters_list:
             case_data['parameters'] = parameters_list
-            case_data['_has_parameters_structure'] = True
     
     if case_id:
         case_data['id'] = case_id
@@ -195,18 +231,14 @@ def transform_case_data(
                 if 'hash' in att_item:
                     source_hash = att_item['hash']
                 elif 'url' in att_item:
-                    url = att_item['url']
-                    match = re.search(r'/attachment/([a-f0-9]{32,64})/', url, re.IGNORECASE)
-                    if match:
-                        source_hash = match.group(1)
+                    source_hash = _attachment_hash_from_url(att_item['url'])
             
             if source_hash:
-                mapped_hash = attachment_mapping.get(source_hash)
+                mapped_hash = attachment_mapping.get(source_hash.lower())
                 if mapped_hash:
                     mapped_case_attachments.append(mapped_hash)
     case_data['attachments'] = mapped_case_attachments
     
-    target_workspace_hash = getattr(mappings, 'target_workspace_hash', None)
     if attachment_mapping:
         case_data['description'] = replace_attachment_hashes_in_text(
             case_data.get('description', ''), attachment_mapping, target_workspace_hash
@@ -218,31 +250,34 @@ def transform_case_data(
             case_data.get('postconditions', ''), attachment_mapping, target_workspace_hash
         )
     
-    if 'custom_fields' in case_dict and case_dict['custom_fields']:
-        for custom_field_item in case_dict['custom_fields']:
-            if isinstance(custom_field_item, dict):
-                field_id_source = custom_field_item.get('id')
-                value = custom_field_item.get('value')
-                if field_id_source is not None:
-                    field_id_target = custom_field_mapping.get(int(field_id_source))
-                    if field_id_target:
-                        mapped_value = value
-                        if isinstance(value, str) and attachment_mapping:
-                            mapped_value = replace_attachment_hashes_in_text(value, attachment_mapping, target_workspace_hash)
-                        case_data['custom_field'][str(field_id_target)] = mapped_value
-    elif 'custom_field' in case_dict and case_dict['custom_field']:
-        for field_id_source, value in case_dict['custom_field'].items():
-            field_id_target = custom_field_mapping.get(int(field_id_source))
-            if field_id_target:
-                mapped_value = value
-                if isinstance(value, str) and attachment_mapping:
-                    mapped_value = replace_attachment_hashes_in_text(value, attachment_mapping, target_workspace_hash)
-                case_data['custom_field'][str(field_id_target)] = mapped_value
+    # Source cases carry either a 'custom_fields' list of {id, value} or a
+    # 'custom_field' {id: value} dict; both reduce to (id, value) pairs.
+    source_custom_fields = case_dict.get('custom_fields')
+    if source_custom_fields:
+        custom_field_pairs = (
+            (item.get('id'), item.get('value'))
+            for item in source_custom_fields if isinstance(item, dict)
+        )
+    else:
+        custom_field_pairs = (case_dict.get('custom_field') or {}).items()
+    
+    for field_id_source, value in custom_field_pairs:
+        if field_id_source is None:
+            continue
+        if not isinstance(field_id_source, int):
+            field_id_source = int(field_id_source)
+        field_id_target = custom_field_mapping.get(field_id_source)
+        if field_id_target:
+            if isinstance(value, str) and attachment_mapping:
+                value = replace_attachment_hashes_in_text(value, attachment_mapping, target_workspace_hash)
+            if not isinstance(field_id_target, str):
+                field_id_target = str(field_id_target)
+            case_data['custom_field'][field_id_target] = value
     
     if 'steps' in case_dict and case_dict['steps']:
         processed_steps = []
         for step in case_dict['steps']:
-            step_dict = to_dict(step)
+            step_dict = step if isinstance(step, dict) else to_dict(step)
             
             # Check for shared step reference
             source_hash = None
@@ -259,6 +294,8 @@ def transform_case_data(
                     source_hash = step_dict['shared_step_hash']
             
             if source_hash:
+                if not isinstance(source_hash, str):
+                    source_hash = str(source_hash)
                 target_hash = shared_step_mapping.get(source_hash)
                 if target_hash:
                     processed_steps.append({'shared': target_hash})
@@ -270,7 +307,7 @@ def transform_case_data(
                 mapped_step_attachments = []
                 if step_attachments and attachment_mapping:
                     for att_hash in step_attachments:
-                        mapped_hash = attachment_mapping.get(att_hash)
+                        mapped_hash = attachment_mapping.get(str(att_hash).lower())
                         if mapped_hash:
                             mapped_step_attachments.append(mapped_hash)
                 
@@ -285,11 +322,15 @@ def transform_case_data(
                     if step_data:
                         step_data = replace_attachment_hashes_in_text(step_data, attachment_mapping, target_workspace_hash)
                 
+                position = step_dict.get('position')
+                if position is None:
+                    position = len(processed_steps) + 1
+                
                 processed_steps.append({
                     'action': step_action,
                     'expected_result': step_expected_result,
                     'data': step_data,
-                    'position': step_dict.get('position', len(processed_steps) + 1),
+                    'position': position,
                     'attachments': mapped_step_attachments
                 })
         
@@ -313,31 +354,41 @@ def migrate_cases(
     stats: MigrationStats,
     preserve_ids: bool = True,
     progress: Optional["ProjectMigrationProgress"] = None,
+    case_create_workers: int = CASE_CREATE_WORKERS,
 ) -> Dict[int, int]:
     """
     Migrate test cases from source to target workspace.
     
+    ``case_create_workers`` > 1 overlaps bulk creates; without ``preserve_ids``
+    the target then assigns ids (and orders cases) by completion, not source order.
+    
     Returns:
         Dictionary mapping source case ID to target case ID
     """
-    from migration.extract.cases import extract_cases
+    from migration.extract.cases import iter_case_pages
     
     case_mapping = {}
     limit = 20
     
     raw_api_client = QaseRawApiClient(
         base_url=target_service.client.configuration.host,
-        api_token=target_service.api_token
+        api_token=target_service.api_token,
+        session=target_service.http,
     )
     
     attachment_mapping = {}
     if project_code_source in mappings.attachments:
-        attachment_mapping = mappings.attachments[project_code_source]
-        normalized_mapping = {}
-        for key, value in attachment_mapping.items():
-            normalized_mapping[key.lower()] = value
-            normalized_mapping[key] = value
-        attachment_mapping = normalized_mapping
+        # Keyed by lowercased source hash; lookups below lowercase as well.
+        attachment_mapping = {
+            key.lower(): value
+            for key, value in mappings.attachments[project_code_source].items()
+        }
+    
+    # Target ids pre-stringified: they are only ever used as custom_field keys
+    custom_field_mapping = {int(k): str(v) for k, v in custom_field_mapping.items() if v}
+    shared_step_mapping = {str(k): v for k, v in shared_step_mapping.items()}
+    target_workspace_hash = getattr(mappings, 'target_workspace_hash', None)
+    resolve_author = make_author_resolver(mappings)
     
     # Use workspace-level shared parameter mapping from mappings
     if hasattr(mappings, 'shared_parameters') and mappings.shared_parameters:
@@ -347,61 +398,97 @@ def migrate_cases(
         shared_parameter_mapping = mappings.shared_parameters
     elif not shared_parameter_mapping:
         shared_parameter_mapping = {}
+    shared_parameter_mapping = {str(k): v for k, v in shared_parameter_mapping.items()}
     
-    all_source_cases = extract_cases(source_service, project_code_source, limit)
-    if progress:
-        progress.reconcile_case_cap(len(all_source_cases))
+    if project_code_source not in mappings.cases:
+        mappings.cases[project_code_source] = {}
+    project_case_mappings = mappings.cases[project_code_source]
     
-    if not all_source_cases:
-        if project_code_source not in mappings.cases:
-            mappings.cases[project_code_source] = {}
-        stats.add_entity('cases', 0, 0)
-        return {}
+    total_cases_processed = 0
+    reused_cases = 0
     
-    batch_size = limit
-    total_cases_processed = len(all_source_cases)
+    def _create_batch(case_data_list, source_ids_batch):
+        if not case_data_list:
+            return source_ids_batch, None
+        return source_ids_batch, raw_api_client.create_cases_bulk(project_code_target, case_data_list)
     
-    for batch_start in range(0, len(all_source_cases), batch_size):
-        batch_cases = all_source_cases[batch_start:batch_start + batch_size]
-        
-        cases_to_create = []
-        
-        for case_dict in batch_cases:
-            case_data = transform_case_data(
-                case_dict, suite_mapping, custom_field_mapping,
-                milestone_mapping, shared_step_mapping, shared_parameter_mapping,
-                user_mapping, attachment_mapping, mappings, preserve_ids
-            )
-            
-            if not case_data:
-                continue
-            
-            source_id = case_dict.get('id')
-            case_data.pop('_has_parameters_structure', False)
-            case_data['_source_id'] = source_id
-            cases_to_create.append(case_data)
-        
-        # Create cases using raw API
-        if cases_to_create:
-            case_data_list = []
-            source_ids_batch = []
-            
-            for case_data in cases_to_create:
-                source_id = case_data.pop('_source_id')
-                case_data_list.append(case_data)
-                source_ids_batch.append(source_id)
-            
-            created_ids = raw_api_client.create_cases_bulk(project_code_target, case_data_list)
-            if created_ids:
-                for idx, source_id in enumerate(source_ids_batch):
-                    if idx < len(created_ids):
-                        case_mapping[source_id] = created_ids[idx]
+    create_errors = []
+    
+    def _collect(future, n_source_cases):
+        # Never raises: a failed batch is recorded so the remaining in-flight
+        # batches are still waited for and written to the mappings.
+        try:
+            source_ids_batch, created_ids = future.result()
+        except Exception as e:
+            logger.error("Bulk case create failed for project %s: %s", project_code_target, e)
+            create_errors.append(e)
+            created_ids = None
+        if created_ids:
+            batch_mapping = {}
+            for idx, source_id in enumerate(source_ids_batch):
+                if idx < len(created_ids):
+                    batch_mapping[source_id] = created_ids[idx]
+            case_mapping.update(batch_mapping)
+            project_case_mappings.update(batch_mapping)
         if progress:
-            progress.add_cases(len(batch_cases))
+            progress.add_cases(n_source_cases)
     
-    if project_code_source not in mappings.cases:
-        mappings.cases[project_code_source] = {}
-    mappings.cases[project_code_source].update(case_mapping)
+    # Stream one page at a time; mappings are updated per batch so a failure
+    # part-way through a project keeps the cases already created. The next source
+    # page is fetched in the background, and up to case_create_workers bulk
+    # creates are in flight while further pages are transformed. Results are
+    # collected on this thread, so the mapping dicts need no lock.
+    case_create_workers = max(1, case_create_workers)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=case_create_workers) as pool:
+        try:
+            for batch_cases in prefetch_iter(iter_case_pages(source_service, project_code_source, limit)):
+                total_cases_processed += len(batch_cases)
+                if progress:
+                    progress.reconcile_case_cap(total_cases_processed)
+                
+                case_data_list = []
+                source_ids_batch = []
+                
+                for case_dict in batch_cases:
+                    source_id = case_dict.get('id')
+                    # Created by an earlier (resumed) run: reuse, don't create twice
+                    existing_id = project_case_mappings.get(source_id)
+                    if existing_id is not None:
+                        case_mapping[source_id] = existing_id
+                        reused_cases += 1
+                        continue
+                    
+                    case_data = transform_case_data(
+                        case_dict, suite_mapping, custom_field_mapping,
+                        milestone_mapping, shared_step_mapping, shared_parameter_mapping,
+                        user_mapping, attachment_mapping, mappings, preserve_ids,
+                        target_workspace_hash, resolve_author
+                    )
+                    
+                    if not case_data:
+                        continue
+                    
+                    case_data_list.append(case_data)
+                    source_ids_batch.append(source_id)
+                
+                # Create cases using raw API
+                pending.append((pool.submit(_create_batch, case_data_list, source_ids_batch), len(batch_cases)))
+                while len(pending) > case_create_workers:
+                    _collect(*pending.popleft())
+                if create_errors:
+                    break
+        finally:
+            # Runs on success and on a source paging/transform error alike; since
+            # _collect does not raise, an exception already propagating is kept.
+            while pending:
+                _collect(*pending.popleft())
+    
+    if create_errors:
+        raise create_errors[0]
     
-    stats.add_entity('cases', total_cases_processed, len(case_mapping))
+    # Cases reused from an earlier run are reported on their own line, not as created
+    stats.add_entity('cases', total_cases_processed - reused_cases, len(case_mapping) - reused_cases)
+    if reused_cases:
+        stats.add_entity('cases_reused', reused_cases, reused_cases)
     return case_mapping
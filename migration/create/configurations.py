@@ -2,7 +2,8 @@
 Create configurations in target Qase workspace.
 """
 import logging
-from typing import Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from qase.api_client_v1.api.configurations_api import ConfigurationsApi
 from qase.api_client_v1.models import ConfigurationGroupCreate, ConfigurationCreate
 from qase_service import QaseService
@@ -10,6 +11,29 @@ from migration.utils import MigrationMappings, MigrationStats, retry_with_backof
 
 logger = logging.getLogger(__name__)
 
+# Configuration groups whose configurations are created concurrently.
+CONFIG_CREATE_WORKERS = 8
+
+
+def _extract_id(response: Any) -> Optional[int]:
+    """
+    Created entity id from a create response.
+    
+    Tries the usual ``status``/``result.id`` shape first, then a bare ``id``,
+    then ``result.id`` without a status.
+    """
+    try:
+        status = response.status
+        result = response.result
+    except AttributeError:
+        pass
+    else:
+        return getattr(result, 'id', None) if status and result else None
+    try:
+        return response.id
+    except AttributeError:
+        return getattr(getattr(response, 'result', None), 'id', None)
+
 
 def migrate_configurations(
     source_service: QaseService,
@@ -17,7 +41,8 @@ def migrate_configurations(
     project_code_source: str,
     project_code_target: str,
     mappings: MigrationMappings,
-    stats: MigrationStats
+    stats: MigrationStats,
+    parallel_steps: bool = False
 ) -> Tuple[Dict[int, int], Dict[int, int]]:
     """
     Migrate configurations from source to target workspace.
@@ -29,6 +54,8 @@ def migrate_configurations(
         project_code_target: Target project code
         mappings: Migration mappings object
         stats: Migration stats object
+        parallel_steps: Create each group's configurations on its own worker
+            (one ``target_service`` clone per worker); otherwise sequentially
     
     Returns:
         Tuple of (configuration_group_mapping, configuration_mapping)
@@ -41,6 +68,39 @@ def migrate_configurations(
     group_mapping = {}
     config_mapping = {}
     
+    existing_configs = mappings.configurations.get(project_code_source, {})
+    
+    def _create_group_configs(
+        target_group_id: int,
+        configs: List[Dict[str, Any]],
+        configs_api_target: ConfigurationsApi = configs_api_target,
+    ) -> List[Tuple[Any, int]]:
+        """Create one group's configurations in source order; returns (source_id, target_id) pairs."""
+        created = []
+        for config_dict in configs:
+            config_data = ConfigurationCreate(
+                title=config_dict['title'],
+                group_id=target_group_id
+            )
+            
+            config_create_response = retry_with_backoff(
+                configs_api_target.create_configuration,
+                code=project_code_target,
+                configuration_create=config_data
+            )
+            
+            if config_create_response:
+                target_config_id = _extract_id(config_create_response)
+                
+                if target_config_id:
+                    created.append((config_dict.get('id'), target_config_id))
+        return created
+    
+    # Groups are created first (configurations need the target group id); each
+    # group's configurations are then created in source order, one group per
+    # worker when parallel_steps is set.
+    pending_groups: List[Tuple[int, List[Dict[str, Any]]]] = []
+    
     for group_dict in groups_list:
         group_data = ConfigurationGroupCreate(title=group_dict['title'])
         
@@ -51,15 +111,7 @@ def migrate_configurations(
         )
         
         if create_response:
-            target_group_id = None
-            if hasattr(create_response, 'status') and hasattr(create_response, 'result'):
-                if create_response.status and create_response.result:
-                    target_group_id = getattr(create_response.result, 'id', None)
-            elif hasattr(create_response, 'id'):
-                target_group_id = create_response.id
-            elif hasattr(create_response, 'result'):
-                result = create_response.result
-                target_group_id = getattr(result, 'id', None)
+            target_group_id = _extract_id(create_response)
             
             if target_group_id:
                 source_group_id = group_dict.get('id')
@@ -74,52 +126,48 @@ def migrate_configurations(
                 elif 'entities' in group_dict:
                     configs_list = group_dict['entities']
                 
-                if configs_list:
-                    for config in configs_list:
-                        config_dict = to_dict(config) if not isinstance(config, dict) else config
-                        config_title = config_dict.get('title')
-                        source_config_id = config_dict.get('id')
-                        
-                        if not config_title:
-                            continue
-                        
-                        # Skip if already mapped
-                        if project_code_source in mappings.configurations and source_config_id in mappings.configurations[project_code_source]:
-                            config_mapping[source_config_id] = mappings.configurations[project_code_source][source_config_id]
-                            continue
-                        
-                        config_data = ConfigurationCreate(
-                            title=config_title,
-                            group_id=target_group_id
-                        )
-                        
-                        config_create_response = retry_with_backoff(
-                            configs_api_target.create_configuration,
-                            code=project_code_target,
-                            configuration_create=config_data
-                        )
-                        
-                        if config_create_response:
-                            target_config_id = None
-                            if hasattr(config_create_response, 'status') and hasattr(config_create_response, 'result'):
-                                if config_create_response.status and config_create_response.result:
-                                    target_config_id = getattr(config_create_response.result, 'id', None)
-                            elif hasattr(config_create_response, 'id'):
-                                target_config_id = config_create_response.id
-                            elif hasattr(config_create_response, 'result'):
-                                result = config_create_response.result
-                                target_config_id = getattr(result, 'id', None)
-                            
-                            if target_config_id:
-                                config_mapping[source_config_id] = target_config_id
+                to_create = []
+                for config in configs_list or ():
+                    config_dict = to_dict(config) if not isinstance(config, dict) else config
+                    source_config_id = config_dict.get('id')
+                    
+                    if not config_dict.get('title'):
+                        continue
+                    
+                    # Skip if already mapped
+                    if source_config_id in existing_configs:
+                        config_mapping[source_config_id] = existing_configs[source_config_id]
+                        continue
+                    
+                    to_create.append(config_dict)
+                
+                if to_create:
+                    pending_groups.append((target_group_id, to_create))
+    
+    def _create_group_configs_on_clone(group: Tuple[int, List[Dict[str, Any]]]) -> List[Tuple[Any, int]]:
+        # SDK clients are not shared across threads: one target clone per task
+        worker_service = target_service.clone()
+        try:
+            return _create_group_configs(*group, ConfigurationsApi(worker_service.client))
+        finally:
+            worker_service.close()
     
-    if project_code_source not in mappings.configuration_groups:
-        mappings.configuration_groups[project_code_source] = {}
-    mappings.configuration_groups[project_code_source].update(group_mapping)
+    if parallel_steps and len(pending_groups) > 1:
+        with ThreadPoolExecutor(max_workers=min(CONFIG_CREATE_WORKERS, len(pending_groups))) as pool:
+            for created in pool.map(_create_group_configs_on_clone, pending_groups):
+                config_mapping.update(created)
+    else:
+        for group in pending_groups:
+            config_mapping.update(_create_group_configs(*group))
     
-    if project_code_source not in mappings.configurations:
-        mappings.configurations[project_code_source] = {}
-    mappings.configurations[project_code_source].update(config_mapping)
+    with mappings.lock:
+        if project_code_source not in mappings.configuration_groups:
+            mappings.configuration_groups[project_code_source] = {}
+        mappings.configuration_groups[project_code_source].update(group_mapping)
+        
+        if project_code_source not in mappings.configurations:
+            mappings.configurations[project_code_source] = {}
+        mappings.configurations[project_code_source].update(config_mapping)
     
     # Count total configurations for stats
     total_configs = 0
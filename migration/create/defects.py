@@ -53,7 +53,7 @@ def migrate_defects(
         api_base = base_url.rstrip('/')
         if not api_base.endswith('/v1'):
             api_base = f"{api_base}/v1"
-        raw_api_client = QaseRawApiClient(api_base, api_token) if api_token else None
+        raw_api_client = QaseRawApiClient(api_base, api_token, target_service.http) if api_token else None
     except Exception:
         logger.error("Cannot initialize raw API client for defects")
         return {}
@@ -165,11 +165,7 @@ def migrate_defects(
                 
                 if source_hash:
                     source_hash_str = str(source_hash).strip()
-                    mapped_hash = (
-                        attachment_mapping.get(source_hash_str.lower()) or 
-                        attachment_mapping.get(source_hash_str) or
-                        attachment_mapping.get(source_hash_str.upper())
-                    )
+                    mapped_hash = attachment_mapping.get(source_hash_str.lower())
                     if mapped_hash:
                         target_attachments.append(str(mapped_hash).strip())
         
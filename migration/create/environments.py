@@ -87,9 +87,10 @@ def migrate_environments(
             if target_id:
                 environment_mapping[source_id] = target_id
     
-    if project_code_source not in mappings.environments:
-        mappings.environments[project_code_source] = {}
-    mappings.environments[project_code_source].update(environment_mapping)
+    with mappings.lock:
+        if project_code_source not in mappings.environments:
+            mappings.environments[project_code_source] = {}
+        mappings.environments[project_code_source].update(environment_mapping)
     
     stats.add_entity('environments', len(environments), len(environment_mapping))
     return environment_mapping
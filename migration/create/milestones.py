@@ -99,9 +99,10 @@ def migrate_milestones(
             milestones_api_target, milestone_mapping
         )
     
-    if project_code_source not in mappings.milestones:
-        mappings.milestones[project_code_source] = {}
-    mappings.milestones[project_code_source].update(milestone_mapping)
+    with mappings.lock:
+        if project_code_source not in mappings.milestones:
+            mappings.milestones[project_code_source] = {}
+        mappings.milestones[project_code_source].update(milestone_mapping)
     
     stats.add_entity('milestones', len(milestones_list), len(milestone_mapping))
     return milestone_mapping
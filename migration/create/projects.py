@@ -131,7 +131,8 @@ def migrate_projects(
     target_service: QaseService,
     mappings: MigrationMappings,
     stats: MigrationStats,
-    only_projects: Optional[List[str]] = None
+    only_projects: Optional[List[str]] = None,
+    skip_projects: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Migrate projects from source to target workspace.
@@ -145,13 +146,14 @@ def migrate_projects(
         mappings: Migration mappings object
         stats: Migration stats object
         only_projects: If provided, migrate only projects with codes in this list
+        skip_projects: If provided, do not migrate projects with codes in this list
     
     Returns:
         List of project mappings
     """
     from migration.extract.projects import extract_projects
     
-    source_projects = extract_projects(source_service, only_projects)
+    source_projects = extract_projects(source_service, only_projects, skip_projects)
     
     projects = []
     for project_dict in source_projects:
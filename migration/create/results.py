@@ -137,20 +137,14 @@ def _looks_like_attachment_hash(s: str) -> bool:
 
 
 def _candidate_hash_keys(h: str) -> List[str]:
-    s = str(h).strip()
+    """Lowercased lookup keys for an attachment hash (as-is, then without UUID dashes)."""
+    s = str(h).strip().lower()
     if not s:
         return []
-    keys = [s, s.lower(), s.upper()]
     if "-" in s:
         nd = s.replace("-", "")
-        keys.extend([nd, nd.lower(), nd.upper()])
-    out: List[str] = []
-    seen = set()
-    for k in keys:
-        if k and k not in seen:
-            seen.add(k)
-            out.append(k)
-    return out
+        return [s, nd] if nd else [s]
+    return [s]
 
 
 def _hashes_from_attachment_item(att_item: Any) -> List[str]:
@@ -217,11 +211,7 @@ def _map_attachment_hashes(
         for raw_h in _hashes_from_attachment_item(att_item):
             mapped_val = None
             for key in _candidate_hash_keys(raw_h):
-                mapped_val = (
-                    attachment_mapping.get(key)
-                    or attachment_mapping.get(key.lower())
-                    or attachment_mapping.get(key.upper())
-                )
+                mapped_val = attachment_mapping.get(key)
                 if mapped_val:
                     break
             if mapped_val:
@@ -615,6 +605,9 @@ def _resolve_target_author_id(
     author_uuid = result_dict.get("author_uuid")
     if author_uuid:
         source_author_id = author_uuid_to_id_mapping.get(author_uuid)
+        if source_author_id is None and not isinstance(author_uuid, str):
+            # Mapping keys are strings (JSON); SDK payloads may carry uuid.UUID
+            source_author_id = author_uuid_to_id_mapping.get(str(author_uuid))
         if source_author_id:
             try:
                 sid = int(source_author_id)
@@ -1731,12 +1724,11 @@ def migrate_results(
 
     attachment_mapping: Dict[str, str] = {}
     if project_code_source in mappings.attachments:
-        attachment_mapping = dict(mappings.attachments[project_code_source])
-        normalized_mapping: Dict[str, str] = {}
-        for key, value in attachment_mapping.items():
-            normalized_mapping[str(key).lower()] = value
-            normalized_mapping[str(key)] = value
-        attachment_mapping = normalized_mapping
+        # Keyed by lowercased source hash only; lookups lowercase as well
+        attachment_mapping = {
+            str(key).lower(): value
+            for key, value in mappings.attachments[project_code_source].items()
+        }
 
     results_api_v2 = ResultsApi(target_service.client_v2)
 
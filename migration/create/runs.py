@@ -99,7 +99,7 @@ def migrate_runs(
         api_base = base_url.rstrip('/')
         if not api_base.endswith('/v1'):
             api_base = f"{api_base}/v1"
-        raw_api_client = QaseRawApiClient(api_base, api_token) if api_token else None
+        raw_api_client = QaseRawApiClient(api_base, api_token, target_service.http) if api_token else None
     except Exception:
         raw_api_client = None
     
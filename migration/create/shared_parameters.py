@@ -5,7 +5,6 @@ import logging
 from typing import Dict, Any, List
 from qase_service import QaseService
 from migration.utils import MigrationMappings, MigrationStats, to_dict, convert_uuids_to_strings
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +34,7 @@ def get_existing_shared_parameters(target_service: QaseService) -> Dict[str, str
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=60)
+            response = target_service.http.get(url, headers=headers, params=params, timeout=60)
             if response.status_code == 200:
                 response_data = response.json()
                 if 'result' in response_data and 'entities' in response_data['result']:
@@ -171,7 +170,7 @@ def migrate_shared_parameters(
         url = f"{base_url}/shared_parameter"
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
+            response = target_service.http.post(url, headers=headers, json=payload, timeout=60)
             if response.status_code == 200:
                 response_data = response.json()
                 if 'result' in response_data and 'id' in response_data['result']:
@@ -76,9 +76,10 @@ def migrate_shared_steps(
                     target_hash = create_response.result.hash
                     shared_step_mapping[source_hash] = target_hash
     
-    if project_code_source not in mappings.shared_steps:
-        mappings.shared_steps[project_code_source] = {}
-    mappings.shared_steps[project_code_source].update(shared_step_mapping)
+    with mappings.lock:
+        if project_code_source not in mappings.shared_steps:
+            mappings.shared_steps[project_code_source] = {}
+        mappings.shared_steps[project_code_source].update(shared_step_mapping)
     
     stats.add_entity('shared_steps', len(shared_steps), len(shared_step_mapping))
     return shared_step_mapping
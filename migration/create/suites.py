@@ -105,9 +105,10 @@ def migrate_suites(
             project_code_target, suites_api_target, suite_mapping, None
         )
     
-    if project_code_source not in mappings.suites:
-        mappings.suites[project_code_source] = {}
-    mappings.suites[project_code_source].update(suite_mapping)
+    with mappings.lock:
+        if project_code_source not in mappings.suites:
+            mappings.suites[project_code_source] = {}
+        mappings.suites[project_code_source].update(suite_mapping)
     
     stats.add_entity('suites', len(all_suites), len(suite_mapping))
     return suite_mapping
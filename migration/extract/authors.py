@@ -2,7 +2,6 @@
 Extract authors from source Qase workspace.
 """
 import logging
-import requests
 from typing import List, Dict, Any
 from qase_service import QaseService
 from migration.step_logging import step_log_info
@@ -59,7 +58,7 @@ def extract_authors(source_service: QaseService) -> Dict[str, int]:
                 'offset': offset
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = source_service.http.get(url, headers=headers, params=params, timeout=30)
             if response.status_code == 200:
                 response_data = response.json()
                 if response_data.get('status') and response_data.get('result'):
@@ -2,7 +2,7 @@
 Extract cases from source Qase workspace.
 """
 import logging
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any
 from qase.api_client_v1.api.cases_api import CasesApi
 from qase_service import QaseService
 from migration.utils import retry_with_backoff, extract_entities_from_response, to_dict
@@ -10,22 +10,21 @@ from migration.utils import retry_with_backoff, extract_entities_from_response,
 logger = logging.getLogger(__name__)
 
 
-def extract_cases(source_service: QaseService, project_code: str, limit: int = 20) -> List[Dict[str, Any]]:
+def iter_case_pages(source_service: QaseService, project_code: str, limit: int = 20) -> Iterator[List[Dict[str, Any]]]:
     """
-    Extract test cases from source project.
+    Yield test cases from source project one API page at a time.
     Uses bulk extraction via get_cases() which returns full case details including steps.
     
     Args:
         source_service: Source Qase service
         project_code: Project code
-        limit: Batch size (default 20)
+        limit: Page size (default 20)
     
-    Returns:
-        List of case dictionaries with full details including steps and member_id
+    Yields:
+        Lists of case dictionaries with full details including steps and member_id
     """
     cases_api_source = CasesApi(source_service.client)
     
-    cases = []
     offset = 0
     
     # Use bulk extraction - get_cases() returns full case details
@@ -41,6 +40,7 @@ def extract_cases(source_service: QaseService, project_code: str, limit: int = 2
         if not source_cases_entities:
             break
         
+        cases = []
         # Convert entities to dictionaries - get_cases() should return full details
         for source_case in source_cases_entities:
             case_dict = to_dict(source_case)
@@ -66,8 +66,30 @@ def extract_cases(source_service: QaseService, project_code: str, limit: int = 2
                         # If individual fetch fails, use summary data
                         cases.append(case_dict)
         
+        if cases:
+            yield cases
+        
         if len(source_cases_entities) < limit:
             break
         offset += limit
+
+
+def extract_cases(source_service: QaseService, project_code: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Extract all test cases from source project.
     
-    return cases
+    Prefer iter_case_pages() for large projects; this collects every page in memory.
+    
+    Args:
+        source_service: Source Qase service
+        project_code: Project code
+        limit: Batch size (default 20)
+    
+    Returns:
+        List of case dictionaries with full details including steps and member_id
+    """
+    return [
+        case_dict
+        for page in iter_case_pages(source_service, project_code, limit)
+        for case_dict in page
+    ]
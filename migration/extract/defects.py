@@ -2,7 +2,6 @@
 Extract defects from source Qase workspace.
 """
 import logging
-import requests
 from typing import List, Dict, Any
 from qase_service import QaseService
 
@@ -59,7 +58,7 @@ def extract_defects(source_service: QaseService, project_code: str) -> List[Dict
                 'offset': offset
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = source_service.http.get(url, headers=headers, params=params, timeout=30)
             if response.status_code == 200:
                 response_data = response.json()
                 if response_data.get('status') and response_data.get('result'):
@@ -10,13 +10,19 @@ from migration.utils import retry_with_backoff, extract_entities_from_response,
 logger = logging.getLogger(__name__)
 
 
-def extract_projects(source_service: QaseService, only_projects: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+def extract_projects(
+    source_service: QaseService,
+    only_projects: Optional[List[str]] = None,
+    skip_projects: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
     """
     Extract all projects from source workspace.
     
     Args:
         source_service: Source Qase service
         only_projects: If provided, extract only projects with codes in this list
+            (pagination stops once all of them have been seen)
+        skip_projects: If provided, leave out projects with codes in this list
     
     Returns:
         List of project dictionaries
@@ -24,6 +30,11 @@ def extract_projects(source_service: QaseService, only_projects: Optional[List[s
     logger.info("Extracting projects from source workspace...")
     if only_projects:
         logger.info(f"Filtering: Only extracting projects: {only_projects}")
+    if skip_projects:
+        logger.info(f"Filtering: Skipping projects: {skip_projects}")
+    only_codes = set(only_projects or ())
+    skip_codes = set(skip_projects or ())
+    pending_codes = only_codes - skip_codes
     
     projects_api_source = ProjectsApi(source_service.client)
     projects = []
@@ -46,14 +57,20 @@ def extract_projects(source_service: QaseService, only_projects: Optional[List[s
             project_code = project_dict.get('code', 'UNKNOWN')
             
             # Filter by project code if only_projects is specified
-            if only_projects and project_code not in only_projects:
+            if only_codes and project_code not in only_codes:
                 logger.debug(f"Skipping project {project_code} - not in only_projects list")
                 continue
+            if project_code in skip_codes:
+                logger.debug(f"Skipping project {project_code} - in skip_projects list")
+                continue
             
             projects.append(project_dict)
+            pending_codes.discard(project_code)
         
         if len(entities) < limit:
             break
+        if only_codes and not pending_codes:
+            break
         offset += limit
 
     # Same project code can appear more than once (pagination / API quirks). Migrating
@@ -2,7 +2,6 @@
 Extract results from source Qase workspace.
 """
 import logging
-import requests
 from typing import List, Dict, Any, Optional
 from qase_service import QaseService
 
@@ -61,7 +60,7 @@ def extract_results(source_service: QaseService, project_code: str, run_id: int)
                 'offset': offset
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = source_service.http.get(url, headers=headers, params=params, timeout=30)
             if response.status_code == 200:
                 response_data = response.json()
                 if response_data.get('status') and response_data.get('result'):
@@ -123,7 +122,7 @@ def fetch_result_detail_json(
     url = f"{api_base}/result/{project_code}/{result_hash}"
     headers = {"Token": api_token, "accept": "application/json"}
     try:
-        response = requests.get(url, headers=headers, timeout=60)
+        response = source_service.http.get(url, headers=headers, timeout=60)
         if response.status_code != 200:
             logger.debug(
                 "fetch_result_detail_json %s: HTTP %s",
@@ -2,7 +2,6 @@
 Extract runs from source Qase workspace.
 """
 import logging
-import requests
 from typing import List, Dict, Any
 from qase.api_client_v1.api.runs_api import RunsApi
 from qase_service import QaseService
@@ -61,7 +60,7 @@ def extract_runs(source_service: QaseService, project_code: str) -> List[Dict[st
                 'offset': offset
             }
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = source_service.http.get(url, headers=headers, params=params, timeout=30)
             if response.status_code == 200:
                 response_data = response.json()
                 if response_data.get('status') and response_data.get('result'):
@@ -122,7 +121,7 @@ def fetch_run_detail_json(
     url = f"{api_base}/run/{project_code}/{int(run_id)}"
     headers = {"Token": api_token, "accept": "application/json"}
     try:
-        response = requests.get(url, headers=headers, timeout=45)
+        response = source_service.http.get(url, headers=headers, timeout=45)
         if response.status_code != 200:
             logger.debug(
                 "fetch_run_detail_json %s/%s: HTTP %s",
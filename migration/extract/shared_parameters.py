@@ -5,7 +5,6 @@ import logging
 from typing import List, Dict, Any
 from qase_service import QaseService
 from migration.utils import retry_with_backoff, to_dict
-import requests
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +43,7 @@ def extract_shared_parameters(source_service: QaseService, project_codes: List[s
                 params[f'filters[project_codes][{idx}]'] = code
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=60)
+            response = source_service.http.get(url, headers=headers, params=params, timeout=60)
             if response.status_code == 200:
                 response_data = response.json()
                 if 'result' in response_data and 'entities' in response_data['result']:
@@ -13,7 +13,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
 from qase.api_client_v1.api.cases_api import CasesApi
 from tqdm import tqdm
 
@@ -124,7 +123,7 @@ def fetch_result_total_for_run(
     headers = {"Token": token, "accept": "application/json"}
     params = {"run": str(int(run_id)), "limit": 1, "offset": 0}
     try:
-        r = requests.get(url, headers=headers, params=params, timeout=30)
+        r = source_service.http.get(url, headers=headers, params=params, timeout=30)
         if r.status_code != 200:
             return 0
         data = r.json()
@@ -7,7 +7,8 @@ MigrationMappings (see migration.utils fork/merge helpers).
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from qase_service import QaseService
 from migration.progress import (
@@ -32,6 +33,93 @@ from migration.create import (
 
 logger = logging.getLogger(__name__)
 
+# Entity types reported in the per-project created/processed summary
+_SUMMARY_TYPES = (
+    "milestones",
+    "configurations",
+    "shared_steps",
+    "suites",
+    "cases",
+    "plans",
+    "runs",
+    "results",
+)
+
+
+class ProjectStep(NamedTuple):
+    """
+    One per-project migration step.
+
+    Every migrate_* function takes ``(source_service, target_service,
+    project_code_source, project_code_target, *args, mappings, stats, **kwargs)``;
+    ``args``/``kwargs`` name entries of the run context, and ``outputs`` names the
+    context entries the return value is stored under (a tuple unpacks it).
+    """
+
+    label: str
+    migrate_fn: Callable[..., Any]
+    outputs: Union[None, str, Tuple[str, ...]] = None
+    args: Tuple[str, ...] = ()
+    kwargs: Tuple[str, ...] = ()
+    independent: bool = False
+
+
+# Independent steps only read the source project and write their own mappings
+# category, so they may run concurrently. The rest run in order, each consuming
+# the mappings produced before it.
+PROJECT_STEPS = (
+    ProjectStep("milestones", migrate_milestones, "milestone_mapping", independent=True),
+    ProjectStep(
+        "configurations",
+        migrate_configurations,
+        ("config_group_mapping", "config_mapping"),
+        kwargs=("parallel_steps",),
+        independent=True,
+    ),
+    ProjectStep("environments", migrate_environments, "environment_mapping", independent=True),
+    ProjectStep("shared steps", migrate_shared_steps, "shared_step_mapping", independent=True),
+    ProjectStep("suites", migrate_suites, "suite_mapping", independent=True),
+    ProjectStep(
+        "test cases",
+        migrate_cases,
+        "case_mapping",
+        args=(
+            "suite_mapping",
+            "custom_field_mapping",
+            "milestone_mapping",
+            "shared_step_mapping",
+            "shared_parameter_mapping",
+            "user_mapping",
+        ),
+        kwargs=("preserve_ids", "progress", "case_create_workers"),
+    ),
+    ProjectStep("test plans", migrate_plans, "plan_mapping", args=("case_mapping",)),
+    ProjectStep(
+        "test runs",
+        migrate_runs,
+        "run_mapping",
+        args=(
+            "case_mapping",
+            "config_mapping",
+            "milestone_mapping",
+            "plan_mapping",
+            "user_mapping",
+        ),
+        kwargs=("source_runs_precached", "progress"),
+    ),
+    ProjectStep(
+        "test results",
+        migrate_results,
+        args=("run_mapping", "case_mapping"),
+        kwargs=("progress",),
+    ),
+    ProjectStep(
+        "defects",
+        migrate_defects,
+        args=("milestone_mapping", "user_mapping", "attachment_mapping"),
+    ),
+)
+
 
 def run_single_project_migration(
     project: Dict[str, Any],
@@ -47,16 +135,28 @@ def run_single_project_migration(
     show_project_progress: bool = True,
     progress_position: int = 0,
     emit_summary_logs: bool = True,
+    parallel_steps: bool = True,
+    case_create_workers: int = 1,
 ) -> Dict[str, str]:
     """
     Run milestones → defects for one project. Mutates mappings and stats.
 
-    If mappings_file is set, saves after each sub-step (resume-friendly).
-    If None, skips saves (parallel workers; parent merges and saves).
+    If mappings_file is set, flushes after each sub-step (resume-friendly; debounced
+    by ``mappings.flush_interval``). If None, skips saves (parallel workers; parent
+    merges and saves).
 
     Set ``emit_summary_logs=False`` when the orchestrator prints summaries once
     at the end (avoids INFO lines interrupting tqdm between projects).
 
+    With ``parallel_steps`` (default), milestones, configurations, environments,
+    shared steps and suites run concurrently before cases, each on its own
+    ``QaseService`` clone (writes to ``mappings`` are serialized by
+    ``mappings.lock``), and configuration groups are filled concurrently;
+    otherwise they run one after another with a flush between each.
+
+    ``case_create_workers`` bulk case creates may be in flight at once (see
+    ``migrate_cases``).
+
     Returns:
         Per-entity ``created/processed`` strings for this project (same keys as summary).
     """
@@ -96,7 +196,7 @@ def run_single_project_migration(
 
     def _save() -> None:
         if mappings_file:
-            mappings.save_to_file(mappings_file)
+            mappings.maybe_flush(mappings_file)
 
     try:
         step_log_info(logger, "\n" + "=" * 60)
@@ -108,216 +208,102 @@ def run_single_project_migration(
         )
         step_log_info(logger, "=" * 60)
 
-        step_log_info(logger, "\nMigrating milestones for %s...", project_code_source)
-        try:
-            milestone_mapping = migrate_milestones(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                mappings,
-                stats,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Milestones migration failed: %s", e, exc_info=True)
-            milestone_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating configurations for %s...", project_code_source)
-        try:
-            config_group_mapping, config_mapping = migrate_configurations(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                mappings,
-                stats,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Configurations migration failed: %s", e, exc_info=True)
-            config_group_mapping = {}
-            config_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating environments for %s...", project_code_source)
-        try:
-            environment_mapping = migrate_environments(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                mappings,
-                stats,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Environments migration failed: %s", e, exc_info=True)
-            environment_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating shared steps for %s...", project_code_source)
-        try:
-            shared_step_mapping = migrate_shared_steps(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                mappings,
-                stats,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Shared steps migration failed: %s", e, exc_info=True)
-            shared_step_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating suites for %s...", project_code_source)
-        try:
-            suite_mapping = migrate_suites(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                mappings,
-                stats,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Suites migration failed: %s", e, exc_info=True)
-            suite_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating test cases for %s...", project_code_source)
-        try:
-            case_mapping = migrate_cases(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                suite_mapping,
-                custom_field_mapping,
-                milestone_mapping,
-                shared_step_mapping,
-                shared_parameter_mapping,
-                user_mapping,
-                mappings,
-                stats,
-                preserve_ids=preserve_ids,
-                progress=progress,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Test cases migration failed: %s", e, exc_info=True)
-            case_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating test plans for %s...", project_code_source)
-        try:
-            plan_mapping = migrate_plans(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                case_mapping,
-                mappings,
-                stats,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Test plans migration failed: %s", e, exc_info=True)
-            plan_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating test runs for %s...", project_code_source)
-        try:
-            run_mapping = migrate_runs(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                case_mapping,
-                config_mapping,
-                milestone_mapping,
-                plan_mapping,
-                user_mapping,
-                mappings,
-                stats,
-                source_runs_precached=source_runs_precached,
-                progress=progress,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Test runs migration failed: %s", e, exc_info=True)
-            run_mapping = {}
-            _save()
-        
-        step_log_info(logger, "\nMigrating test results for %s...", project_code_source)
-        try:
-            migrate_results(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                run_mapping,
-                case_mapping,
-                mappings,
-                stats,
-                progress=progress,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Test results migration failed: %s", e, exc_info=True)
-            _save()
-        
-        step_log_info(logger, "\nMigrating defects for %s...", project_code_source)
-        try:
-            attachment_mapping: Dict[str, Any] = {}
-            if project_code_source in mappings.attachments:
-                attachment_mapping = mappings.attachments[project_code_source]
-                normalized_mapping = {}
-                for key, value in attachment_mapping.items():
-                    normalized_mapping[key.lower()] = value
-                    normalized_mapping[key] = value
-                attachment_mapping = normalized_mapping
-        
-            migrate_defects(
-                source_service,
-                target_service,
-                project_code_source,
-                project_code_target,
-                milestone_mapping,
-                user_mapping,
-                attachment_mapping,
-                mappings,
-                stats,
-            )
-            _save()
-        except Exception as e:
-            logger.error("✗ Defects migration failed: %s", e, exc_info=True)
+        attachment_mapping: Dict[str, Any] = {}
+        if project_code_source in mappings.attachments:
+            attachment_mapping = {
+                key.lower(): value
+                for key, value in mappings.attachments[project_code_source].items()
+            }
+
+        # Inputs and outputs of PROJECT_STEPS, by name
+        ctx: Dict[str, Any] = {
+            "user_mapping": user_mapping,
+            "custom_field_mapping": custom_field_mapping,
+            "shared_parameter_mapping": shared_parameter_mapping,
+            "attachment_mapping": attachment_mapping,
+            "preserve_ids": preserve_ids,
+            "progress": progress,
+            "source_runs_precached": source_runs_precached,
+            "parallel_steps": parallel_steps,
+            "case_create_workers": case_create_workers,
+        }
+        quiet = progress is not None
+
+        def _run_step(
+            step: ProjectStep,
+            step_source: QaseService = source_service,
+            step_target: QaseService = target_service,
+        ) -> Any:
+            """Run one step; log and return None (stored as empty mappings) if it raises."""
+            set_migration_progress_console_quiet(quiet)
+            step_log_info(logger, "\nMigrating %s for %s...", step.label, project_code_source)
+            try:
+                return step.migrate_fn(
+                    step_source,
+                    step_target,
+                    project_code_source,
+                    project_code_target,
+                    *[ctx[name] for name in step.args],
+                    mappings,
+                    stats,
+                    **{name: ctx[name] for name in step.kwargs},
+                )
+            except Exception as e:
+                logger.error(
+                    "✗ %s migration failed: %s", step.label.capitalize(), e, exc_info=True
+                )
+                return None
+
+        def _store(step: ProjectStep, result: Any) -> None:
+            if isinstance(step.outputs, tuple):
+                values = result if result is not None else ({},) * len(step.outputs)
+                ctx.update(zip(step.outputs, values))
+            elif step.outputs:
+                ctx[step.outputs] = result if result is not None else {}
+
+        independent_steps = [step for step in PROJECT_STEPS if step.independent]
+        if parallel_steps:
+            # SDK clients are not shared across threads: each concurrent step gets
+            # its own services. Their mapping writes go through mappings.lock.
+            step_services = [
+                (source_service.clone(), target_service.clone()) for _ in independent_steps
+            ]
+            try:
+                with ThreadPoolExecutor(max_workers=len(independent_steps)) as pool:
+                    step_futures = [
+                        pool.submit(_run_step, step, step_source, step_target)
+                        for step, (step_source, step_target) in zip(independent_steps, step_services)
+                    ]
+                    for step, future in zip(independent_steps, step_futures):
+                        _store(step, future.result())
+            finally:
+                for step_source, step_target in step_services:
+                    step_source.close()
+                    step_target.close()
             _save()
-        
+        else:
+            for step in independent_steps:
+                _store(step, _run_step(step))
+                _save()
+
+        for step in PROJECT_STEPS:
+            if not step.independent:
+                _store(step, _run_step(step))
+                _save()
+
         if progress is not None:
             progress.close()
             progress = None
 
         set_migration_progress_console_quiet(False)
 
-        for entity_type in [
-            "milestones",
-            "configurations",
-            "shared_steps",
-            "suites",
-            "cases",
-            "plans",
-            "runs",
-            "results",
-        ]:
-            if entity_type in stats.entities_created:
-                created = stats.entities_created.get(entity_type, 0)
-                processed = stats.entities_processed.get(entity_type, 0)
-                project_stats[entity_type] = f"{created}/{processed}"
+        created = stats.entities_created
+        processed = stats.entities_processed
+        project_stats = {
+            entity_type: f"{created[entity_type]}/{processed.get(entity_type, 0)}"
+            for entity_type in _SUMMARY_TYPES
+            if entity_type in created
+        }
 
         if emit_summary_logs:
             logger.info("\nCompleted migration for project %s", project_code_source)
@@ -7,6 +7,35 @@ from typing import Dict, List, Optional, Set, Any
 
 logger = logging.getLogger(__name__)
 
+# /attachment/{hash}/ and /attachments/{hash}/; hash may be UUID (reporters, video/screenshot links)
+_HASH_IN_TEXT_RE = re.compile(
+    r"/attachments?/"
+    r"([a-f0-9]{32,64}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})"
+    r"/",
+    re.IGNORECASE,
+)
+
+# Full markdown image links: ![filename](URL); captures both the URL and hash
+_MARKDOWN_ATTACHMENT_URL_RE = re.compile(
+    r'!\[[^\]]*\]\('
+    r'(https://[^\)]+/attachments?/'
+    r'([a-f0-9]{32,64}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})'
+    r'/[^\)]+)\)',
+    re.IGNORECASE,
+)
+
+# https://.../public/team/{WORKSPACE_HASH}/attachment/{ATTACHMENT_HASH}/filename
+_FULL_ATTACHMENT_URL_RE = re.compile(
+    r'(https://[^/]+/public/team/)([a-f0-9]{32,64})(/attachment/)([a-f0-9]{32,64})(/[^\)]+)',
+    re.IGNORECASE,
+)
+
+# Cheap prefilter for replace_attachment_hashes_in_text (no copy of the text)
+_ATTACHMENT_SEGMENT_PREFILTER_RE = re.compile(r'/attachment/', re.IGNORECASE)
+
+# Bare /attachment/{HASH}/ segment (fallback when there is no team prefix)
+_ATTACHMENT_HASH_SEGMENT_RE = re.compile(r'(/attachment/)([a-f0-9]{32,64})(/)', re.IGNORECASE)
+
 
 def extract_attachment_hashes_from_text(text: str) -> Set[str]:
     """
@@ -24,15 +53,8 @@ def extract_attachment_hashes_from_text(text: str) -> Set[str]:
     if not text or not isinstance(text, str):
         return set()
     
-    # /attachment/{hash}/ and /attachments/{hash}/; hash may be UUID (reporters, video/screenshot links)
-    pattern = (
-        r"/attachments?/"
-        r"([a-f0-9]{32,64}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})"
-        r"/"
-    )
-
     hashes = set()
-    matches = re.findall(pattern, text, re.IGNORECASE)
+    matches = _HASH_IN_TEXT_RE.findall(text)
     for match in matches:
         hashes.add(str(match).replace("-", "").lower())
 
@@ -54,17 +76,8 @@ def extract_attachment_urls_from_text(text: str) -> Dict[str, str]:
     if not text or not isinstance(text, str):
         return {}
     
-    # Pattern to match full markdown image links: ![filename](URL)
-    # Extract both the URL and hash
-    pattern = (
-        r'!\[[^\]]*\]\('
-        r'(https://[^\)]+/attachments?/'
-        r'([a-f0-9]{32,64}|[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})'
-        r'/[^\)]+)\)'
-    )
-
     url_map = {}
-    matches = re.findall(pattern, text, re.IGNORECASE)
+    matches = _MARKDOWN_ATTACHMENT_URL_RE.findall(text)
     for full_url, hash_match in matches:
         url_map[str(hash_match).replace("-", "").lower()] = full_url
 
@@ -165,7 +178,8 @@ def replace_attachment_hashes_in_text(text: str, attachment_mapping: Dict[str, s
     
     Args:
         text: Text content containing markdown image links
-        attachment_mapping: Dictionary mapping source_hash -> target_hash
+        attachment_mapping: Dictionary mapping source_hash -> target_hash; must contain
+            lowercased source hashes (matched hashes are lowercased before lookup)
         target_workspace_hash: Target workspace/team hash to replace source workspace hash
         
     Returns:
@@ -174,9 +188,9 @@ def replace_attachment_hashes_in_text(text: str, attachment_mapping: Dict[str, s
     if not text or not isinstance(text, str) or not attachment_mapping:
         return text
     
-    # Pattern to match full attachment URLs with both workspace hash and attachment hash
-    # Matches: https://.../public/team/{WORKSPACE_HASH}/attachment/{ATTACHMENT_HASH}/filename
-    full_url_pattern = r'(https://[^/]+/public/team/)([a-f0-9]{32,64})(/attachment/)([a-f0-9]{32,64})(/[^\)]+)'
+    # Both patterns below need an /attachment/ segment; most text fields have none
+    if not _ATTACHMENT_SEGMENT_PREFILTER_RE.search(text):
+        return text
     
     def replace_full_url(match):
         url_prefix = match.group(1)  # https://.../public/team/
@@ -187,12 +201,6 @@ def replace_attachment_hashes_in_text(text: str, attachment_mapping: Dict[str, s
         
         # Replace attachment hash
         new_attachment_hash = attachment_mapping.get(old_attachment_hash)
-        if not new_attachment_hash:
-            # Try case-insensitive lookup
-            for key, value in attachment_mapping.items():
-                if key.lower() == old_attachment_hash:
-                    new_attachment_hash = value
-                    break
         
         # Replace workspace hash if target workspace hash is provided
         new_workspace_hash = target_workspace_hash if target_workspace_hash else old_workspace_hash
@@ -204,25 +212,18 @@ def replace_attachment_hashes_in_text(text: str, attachment_mapping: Dict[str, s
             return match.group(0)  # Return original if no mapping found
     
     # Replace full URLs first (with workspace hash)
-    text = re.sub(full_url_pattern, replace_full_url, text, flags=re.IGNORECASE)
+    text = _FULL_ATTACHMENT_URL_RE.sub(replace_full_url, text)
     
     # Also handle URLs that only have /attachment/{HASH}/ pattern (fallback)
-    pattern = r'(/attachment/)([a-f0-9]{32,64})(/)'
-    
     def replace_hash(match):
         prefix = match.group(1)
         old_hash = match.group(2).lower()
         suffix = match.group(3)
         
         new_hash = attachment_mapping.get(old_hash)
-        if not new_hash:
-            for key, value in attachment_mapping.items():
-                if key.lower() == old_hash:
-                    new_hash = value
-                    break
         
         if new_hash:
             return f"{prefix}{new_hash}{suffix}"
         return match.group(0)
     
-    return re.sub(pattern, replace_hash, text, flags=re.IGNORECASE)
+    return _ATTACHMENT_HASH_SEGMENT_RE.sub(replace_hash, text)
@@ -3,25 +3,40 @@ Migration utilities - Helper functions for data processing, ID mapping, and erro
 """
 import json
 import logging
+import os
+import queue
 import threading
 import time
 import hashlib
 import uuid
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime
 from qase.api_client_v1.exceptions import ApiException
 import requests
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 # Bulk POSTs (cases, etc.) can exceed 60s server-side on api.qase.io.
 _QASE_RAW_BULK_TIMEOUT = (30.0, 180.0)  # (connect, read) seconds
 
+# Minimum seconds between intermediate mappings.json rewrites (see maybe_flush).
+DEFAULT_MAPPINGS_FLUSH_INTERVAL = 30.0
+
+
+def _coerce_int_keys(d: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Turn numeric string keys (as written by json.dump) back into ints."""
+    return {
+        int(k) if isinstance(k, str) and k.lstrip('-').isdigit() else k: v
+        for k, v in d.items()
+        if k != ''
+    }
+
+
+def _coerce_project_int_keys(d: Dict[str, Dict[Any, Any]]) -> Dict[str, Dict[Any, Any]]:
+    """Apply _coerce_int_keys to each per-project mapping."""
+    return {project: _coerce_int_keys(m) for project, m in d.items()}
+
 
 class MigrationMappings:
     """Stores mappings between source and target entity IDs."""
@@ -49,9 +64,14 @@ class MigrationMappings:
         self.target_workspace_hash = None
         # Optional migration.trace_log.MigrationTrace — not persisted in mappings JSON
         self.trace = None
+        # Debounce for intermediate saves (maybe_flush); not persisted
+        self.flush_interval = DEFAULT_MAPPINGS_FLUSH_INTERVAL
+        self._last_saved_at = 0.0
+        # Guards mapping writes from steps that run concurrently on one project; not persisted
+        self.lock = threading.RLock()
 
     def save_to_file(self, filepath: str):
-        """Save mappings to JSON file."""
+        """Save mappings to JSON file (written to a temp file, then atomically renamed)."""
         mappings_dict = {
             'projects': self.projects,
             'suites': self.suites,
@@ -73,8 +93,26 @@ class MigrationMappings:
             'defects': getattr(self, 'defects', {}),
             'result_hashes': getattr(self, 'result_hashes', {})
         }
-        with open(filepath, 'w') as f:
+        tmp_path = f"{filepath}.tmp"
+        with self.lock, open(tmp_path, 'w') as f:
             json.dump(mappings_dict, f, indent=2)
+        os.replace(tmp_path, filepath)
+        self._last_saved_at = time.monotonic()
+
+    def maybe_flush(self, filepath: str) -> bool:
+        """
+        Save mappings unless the last save was less than ``flush_interval`` seconds ago.
+
+        Use between migration steps; call save_to_file() directly on completion,
+        interruption, or failure so the final state is always written.
+
+        Returns:
+            True if the file was written
+        """
+        if time.monotonic() - self._last_saved_at < self.flush_interval:
+            return False
+        self.save_to_file(filepath)
+        return True
     
     def get_user_id(self, id: int, default_user_id: int = 1) -> int:
         """
@@ -101,25 +139,26 @@ class MigrationMappings:
             with open(filepath, 'r') as f:
                 mappings_dict = json.load(f)
             self.projects = mappings_dict.get('projects', {})
-            self.suites = mappings_dict.get('suites', {})
-            self.cases = mappings_dict.get('cases', {})
-            self.runs = mappings_dict.get('runs', {})
-            self.milestones = mappings_dict.get('milestones', {})
-            self.configurations = mappings_dict.get('configurations', {})
-            self.configuration_groups = mappings_dict.get('configuration_groups', {})
-            self.environments = mappings_dict.get('environments', {})
+            self.suites = _coerce_project_int_keys(mappings_dict.get('suites', {}))
+            self.cases = _coerce_project_int_keys(mappings_dict.get('cases', {}))
+            self.runs = _coerce_project_int_keys(mappings_dict.get('runs', {}))
+            self.milestones = _coerce_project_int_keys(mappings_dict.get('milestones', {}))
+            self.configurations = _coerce_project_int_keys(mappings_dict.get('configurations', {}))
+            self.configuration_groups = _coerce_project_int_keys(
+                mappings_dict.get('configuration_groups', {})
+            )
+            self.environments = _coerce_project_int_keys(mappings_dict.get('environments', {}))
             self.shared_steps = mappings_dict.get('shared_steps', {})
             self.shared_parameters = mappings_dict.get('shared_parameters', {})
-            self.custom_fields = mappings_dict.get('custom_fields', {})
-            # Convert user mapping keys from strings to integers (JSON stores keys as strings)
-            users_dict = mappings_dict.get('users', {})
-            self.users = {int(k): v for k, v in users_dict.items() if k} if users_dict else {}
+            self.custom_fields = _coerce_int_keys(mappings_dict.get('custom_fields', {}))
+            # JSON stores keys as strings; source IDs are looked up as ints
+            self.users = _coerce_int_keys(mappings_dict.get('users', {}))
             self.user_email_mapping = mappings_dict.get('user_email_mapping', {})
             self.user_uuid_mapping = mappings_dict.get('user_uuid_mapping', {})
             self.author_uuid_to_id_mapping = mappings_dict.get('author_uuid_to_id_mapping', {})
             self.attachments = mappings_dict.get('attachments', {})
-            self.plans = mappings_dict.get('plans', {})
-            self.defects = mappings_dict.get('defects', {})
+            self.plans = _coerce_project_int_keys(mappings_dict.get('plans', {}))
+            self.defects = _coerce_project_int_keys(mappings_dict.get('defects', {}))
             self.result_hashes = mappings_dict.get('result_hashes', {})
             self.target_workspace_hash = mappings_dict.get('target_workspace_hash')
         except FileNotFoundError:
@@ -189,12 +228,18 @@ PARALLEL_PROJECT_MAPPING_ATTRS = (
 )
 
 
-def fork_mappings_for_parallel_project(base: "MigrationMappings") -> "MigrationMappings":
+def fork_mappings_for_parallel_project(
+    base: "MigrationMappings", project_source: Optional[str] = None
+) -> "MigrationMappings":
     """
     Shallow fork for a parallel worker: share read-only workspace-level dicts;
-    project-specific buckets start empty on the fork (filled during the worker).
+    project-specific buckets start empty on the fork (filled during the worker),
+    except ``cases``, which is seeded with a copy of ``project_source``'s slice
+    so migrate_cases can skip cases a resumed run already created.
     """
     m = MigrationMappings()
+    if project_source is not None and base.cases.get(project_source):
+        m.cases[project_source] = dict(base.cases[project_source])
     m.users = base.users
     m.user_email_mapping = base.user_email_mapping
     m.user_uuid_mapping = base.user_uuid_mapping
@@ -482,6 +527,59 @@ def chunks(lst: List, n: int):
         yield lst[i:i + n]
 
 
+_PREFETCH_DONE = object()
+
+
+def prefetch_iter(iterable: Iterable, depth: int = 1) -> Iterator:
+    """
+    Iterate ``iterable`` on a background thread, keeping up to ``depth`` items ready.
+
+    Used to download the next source page while the caller creates the current one
+    on the target. Producer exceptions are re-raised in the caller; if the caller
+    stops early, the producer exits at its next put.
+    
+    Args:
+        iterable: Source iterable (e.g. a page generator)
+        depth: Number of items buffered ahead of the consumer
+    
+    Yields:
+        Items of ``iterable`` in order
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def _put(entry: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except BaseException as e:
+            _put((_PREFETCH_DONE, e))
+            return
+        _put((_PREFETCH_DONE, None))
+
+    threading.Thread(target=_produce, name="prefetch", daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _PREFETCH_DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
 def to_dict(obj: Any) -> Dict[str, Any]:
     """
     Convert object to dictionary.
@@ -492,6 +590,9 @@ def to_dict(obj: Any) -> Dict[str, Any]:
     Returns:
         Dictionary representation
     """
+    # Plain dicts are the common input; checking first skips a failing hasattr
+    if type(obj) is dict:
+        return obj
     if hasattr(obj, 'to_dict'):
         return obj.to_dict()
     elif isinstance(obj, dict):
@@ -551,15 +652,18 @@ def convert_uuids_to_strings(obj: Any) -> Any:
 class QaseRawApiClient:
     """Raw HTTP API client for operations that SDK doesn't support well."""
     
-    def __init__(self, base_url: str, api_token: str):
+    def __init__(self, base_url: str, api_token: str, session: Optional[requests.Session] = None):
         """
         Initialize raw API client.
         
         Args:
             base_url: Base API URL (e.g., https://api.qase.io/v1)
             api_token: API token
+            session: Shared pooled session (e.g. ``QaseService.http``); a private
+                session is created when omitted so connections are still kept alive
         """
         self.base_url = base_url.rstrip('/')
+        self.session = session if session is not None else requests.Session()
         self.headers = {
             'Token': api_token,
             'Content-Type': 'application/json'
@@ -586,7 +690,7 @@ class QaseRawApiClient:
             if attempt:
                 time.sleep(min(2 ** (attempt - 1), 8))
             try:
-                response = requests.post(
+                response = self.session.post(
                     url,
                     headers=self.headers,
                     json=payload,
@@ -636,7 +740,7 @@ class QaseRawApiClient:
         payload = {"results": convert_uuids_to_strings(results)}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 url, headers=self.headers, json=payload, timeout=_QASE_RAW_BULK_TIMEOUT
             )
             if response.status_code == 200:
@@ -664,7 +768,7 @@ class QaseRawApiClient:
         """
         url = f"{self.base_url}/result/{project_code}/{run_id}/{result_hash}"
         try:
-            response = requests.patch(
+            response = self.session.patch(
                 url, headers=self.headers, json=body, timeout=120
             )
             if response.status_code == 200:
@@ -699,7 +803,7 @@ class QaseRawApiClient:
 
         for attempt in range(max_attempts):
             try:
-                response = requests.post(
+                response = self.session.post(
                     url, headers=self.headers, json=run_data, timeout=60
                 )
                 if response.status_code == 200:
@@ -764,7 +868,7 @@ class QaseRawApiClient:
         url = f"{self.base_url}/defect/{project_code}"
         
         try:
-            response = requests.post(url, headers=self.headers, json=defect_data, timeout=60)
+            response = self.session.post(url, headers=self.headers, json=defect_data, timeout=60)
             if response.status_code == 200:
                 response_data = response.json()
                 if response_data.get('status') and response_data.get('result'):
@@ -795,7 +899,7 @@ class QaseRawApiClient:
         url = f"{self.base_url}/defect/{project_code}/resolve/{defect_id}"
         
         try:
-            response = requests.patch(url, headers=self.headers, timeout=60)
+            response = self.session.patch(url, headers=self.headers, timeout=60)
             return response.status_code == 200
         except Exception:
             return False
@@ -834,12 +938,12 @@ class QaseRawApiClient:
         
         try:
             # Try PUT first
-            response = requests.put(url, headers=self.headers, json=payload, timeout=60)
+            response = self.session.put(url, headers=self.headers, json=payload, timeout=60)
             if response.status_code == 200:
                 return True
             
             # Try PATCH if PUT doesn't work
-            patch_response = requests.patch(url, headers=self.headers, json=payload, timeout=60)
+            patch_response = self.session.patch(url, headers=self.headers, json=payload, timeout=60)
             if patch_response.status_code == 200:
                 return True
                 
@@ -871,7 +975,7 @@ class QaseRawApiClient:
         }
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=60)
+            response = self.session.post(url, headers=self.headers, json=payload, timeout=60)
             if response.status_code == 200:
                 return True
             else:
@@ -30,13 +30,16 @@ if _parent_utils_path.exists():
         format_datetime = utils_module.format_datetime
         format_date = utils_module.format_date
         preserve_or_hash_id = utils_module.preserve_or_hash_id
+        MAX_SAFE_ID = utils_module.MAX_SAFE_ID
         chunks = utils_module.chunks
+        prefetch_iter = utils_module.prefetch_iter
         convert_uuids_to_strings = utils_module.convert_uuids_to_strings
         QaseRawApiClient = utils_module.QaseRawApiClient
         PARALLEL_PROJECT_MAPPING_ATTRS = utils_module.PARALLEL_PROJECT_MAPPING_ATTRS
         fork_mappings_for_parallel_project = utils_module.fork_mappings_for_parallel_project
         merge_parallel_project_into_main = utils_module.merge_parallel_project_into_main
         merge_migration_stats = utils_module.merge_migration_stats
+        DEFAULT_MAPPINGS_FLUSH_INTERVAL = utils_module.DEFAULT_MAPPINGS_FLUSH_INTERVAL
 
         __all__ = [
             'QaseScimClient',
@@ -48,13 +51,16 @@ if _parent_utils_path.exists():
             'format_datetime',
             'format_date',
             'preserve_or_hash_id',
+            'MAX_SAFE_ID',
             'chunks',
+            'prefetch_iter',
             'convert_uuids_to_strings',
             'QaseRawApiClient',
             'PARALLEL_PROJECT_MAPPING_ATTRS',
             'fork_mappings_for_parallel_project',
             'merge_parallel_project_into_main',
             'merge_migration_stats',
+            'DEFAULT_MAPPINGS_FLUSH_INTERVAL',
         ]
     else:
         # Fallback: only export SCIM client if utils.py can't be loaded
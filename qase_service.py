@@ -6,6 +6,30 @@ from qase.api_client_v1.configuration import Configuration
 from qase.api_client_v2.api_client import ApiClient as ApiClientV2
 from qase.api_client_v2.configuration import Configuration as ConfigurationV2
 import certifi
+import requests
+from requests.adapters import HTTPAdapter
+
+# Raw REST calls (run/result/defect listings, attachments) share one keep-alive pool
+# per service instead of opening a new TCP/TLS connection for every request.
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+
+def build_http_session() -> requests.Session:
+    """
+    Create a pooled ``requests.Session`` for raw Qase HTTP calls.
+
+    No transport-level retry: 429/5xx handling stays in the call-site retry loops,
+    so waits are not doubled and ``QaseApiRateLimiter`` sees every 429.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class QaseService:
@@ -60,9 +84,30 @@ class QaseService:
         # Add custom header for migration
         self.client_v2.default_headers['migration'] = 'true'
         
+        # Pooled session for raw HTTP calls that bypass the SDK clients
+        self.http = build_http_session()
+        
         # Initialize SCIM client if token is provided
         if scim_token:
             from migration.utils.scim_client import QaseScimClient
             self.scim_client = QaseScimClient(scim_token, self.scim_host, ssl)
         else:
-            self.scim_client = None
\ No newline at end of file
+            self.scim_client = None
+
+    def clone(self) -> "QaseService":
+        """New service with the same credentials and hosts but its own SDK clients and HTTP session (one per worker thread)."""
+        return QaseService(
+            api_token=self.api_token,
+            host=self.host,
+            ssl=self.ssl,
+            scim_token=self.scim_token,
+            scim_host=self.scim_host,
+        )
+
+    def close(self) -> None:
+        """Release pooled connections (raw HTTP session and SDK REST pools); use on clones when a worker finishes."""
+        self.http.close()
+        for api_client in (self.client, self.client_v2):
+            pool_manager = getattr(getattr(api_client, 'rest_client', None), 'pool_manager', None)
+            if pool_manager is not None:
+                pool_manager.clear()
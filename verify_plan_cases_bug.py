@@ -12,6 +12,7 @@ Safe: only touches the target workspace; uses a unique project code; cleans up.
 Run from the repo root: python3 verify_plan_cases_bug.py
 """
 import json
+import logging
 import sys
 import time
 import requests
@@ -165,4 +166,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # migration.* modules no longer configure logging on import
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     main()
@@ -7,6 +7,7 @@ Special attention to runs whose source had a plan_id — those are the ones
 exposed to the plan-cases bug.
 """
 import json
+import logging
 import sys
 import time
 from collections import defaultdict
@@ -112,4 +113,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # migration.* modules no longer configure logging on import
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     main()